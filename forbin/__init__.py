@@ -1,10 +1,7 @@
+from typing import TYPE_CHECKING
+
 from .cli import main as main, interactive_session as interactive_session
-from .client import (
-    connect_to_mcp_server as connect_to_mcp_server,
-    connect_and_list_tools as connect_and_list_tools,
-    wake_up_server as wake_up_server,
-    MCPSession as MCPSession,
-)
+from .async_loop import AsyncLoopThread as AsyncLoopThread
 from .tools import (
     list_tools as list_tools,
     call_tool as call_tool,
@@ -17,11 +14,38 @@ from .display import (
     display_tool_schema as display_tool_schema,
 )
 
+if TYPE_CHECKING:
+    from .client import (
+        connect_to_mcp_server as connect_to_mcp_server,
+        connect_and_list_tools as connect_and_list_tools,
+        wake_up_server as wake_up_server,
+        MCPSession as MCPSession,
+    )
+
+# The MCP client stack (fastmcp, httpx, anyio) is slow to import, so these are
+# resolved on first access (PEP 562) rather than when the package is imported
+_LAZY_CLIENT_EXPORTS = (
+    "connect_to_mcp_server",
+    "connect_and_list_tools",
+    "wake_up_server",
+    "MCPSession",
+)
+
+
+def __getattr__(name):
+    if name in _LAZY_CLIENT_EXPORTS:
+        from . import client
+
+        return getattr(client, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __version__ = "0.1.0"
 
 __all__ = [
     "main",
     "interactive_session",
+    "AsyncLoopThread",
     "connect_to_mcp_server",
     "connect_and_list_tools",
     "wake_up_server",
@@ -0,0 +1,94 @@
+import asyncio
+import concurrent.futures
+import threading
+from typing import Any, Coroutine, Optional
+
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - depends on the environment
+    uvloop = None
+
+
+def new_event_loop() -> asyncio.AbstractEventLoop:
+    """Create a uvloop loop if the [fast] extra is installed, else a stdlib one."""
+    if uvloop is not None:
+        return uvloop.new_event_loop()
+    return asyncio.new_event_loop()
+
+
+class AsyncLoopThread:
+    """
+    A single, persistent event loop running on a daemon thread.
+
+    All MCP I/O runs on this one loop for the life of the process, so the
+    session's anyio task groups and cancel scopes are always entered and
+    exited on the same loop. Synchronous callers hand work to it with
+    submit() or run().
+    """
+
+    def __init__(self):
+        self.loop = new_event_loop()
+        self._thread = threading.Thread(target=self._run_loop, name="forbin-loop", daemon=True)
+        self._thread.start()
+
+    def _run_loop(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def submit(self, coro: Coroutine[Any, Any, Any]) -> concurrent.futures.Future:
+        """Schedule a coroutine on the loop and return a concurrent future for its result."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro: Coroutine[Any, Any, Any], cleanup_timeout: float = 10.0) -> Any:
+        """
+        Run a coroutine on the loop and block until it finishes.
+
+        On Ctrl+C the coroutine is cancelled and given up to cleanup_timeout
+        seconds to run its finally blocks (closing MCP sessions etc.) before
+        KeyboardInterrupt is re-raised.
+
+        Args:
+            coro: The coroutine to run
+            cleanup_timeout: Seconds to wait for cleanup after Ctrl+C
+
+        Returns:
+            The coroutine's result
+        """
+        finished = threading.Event()
+
+        async def _runner():
+            try:
+                return await coro
+            finally:
+                finished.set()
+
+        future = self.submit(_runner())
+        try:
+            return future.result()
+        except KeyboardInterrupt:
+            future.cancel()
+            finished.wait(cleanup_timeout)
+            raise
+
+    def stop(self, timeout: Optional[float] = 5.0):
+        """Cancel leftover tasks, stop the loop and close it."""
+        if self.loop.is_closed():
+            return
+
+        async def _shutdown():
+            tasks = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await self.loop.shutdown_asyncgens()
+
+        if self._thread.is_alive():
+            try:
+                self.submit(_shutdown()).result(timeout)
+            except Exception:
+                pass
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self._thread.join(timeout)
+
+        if not self._thread.is_alive():
+            self.loop.close()
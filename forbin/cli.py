@@ -1,9 +1,9 @@
 import asyncio
+import importlib
 import sys
+import threading
 import time
 
-from rich.prompt import Prompt
-
 from . import config
 from .config import (
     validate_config,
@@ -14,61 +14,89 @@ from .config import (
     save_config,
     CONFIG_FILE,
 )
-from .utils import setup_logging, listen_for_toggle
-from .client import connect_and_list_tools, wake_up_server
-from .tools import get_tool_parameters, call_tool
-from .verbose import vlog_timing
+from .async_loop import AsyncLoopThread
+from .utils import setup_logging, listen_for_toggle, ainput, aprompt
+from .tools import get_tool_parameters, call_tool, call_tools_batch
+from .verbose import vlog_timing, vtimed
 from .display import (
     display_tools,
     display_tool_header,
     display_tool_menu,
+    display_command_menu,
+    display_help,
     display_tool_schema,
     display_logo,
     display_config_panel,
+    display_config_settings,
     display_step,
     console,
 )
 
+# Prompt input -> action, for the tool list and tool view menus
+_TOOL_LIST_COMMANDS = {
+    "q": "quit",
+    "quit": "quit",
+    "exit": "quit",
+    "v": "verbose",
+    "c": "config",
+}
+
+_TOOL_VIEW_COMMANDS = {
+    "d": "details",
+    "details": "details",
+    "1": "details",
+    "r": "run",
+    "run": "run",
+    "2": "run",
+    "b": "back",
+    "back": "back",
+    "3": "back",
+    **_TOOL_LIST_COMMANDS,
+}
+
+# Attempts for the wake-up and connect steps, and the backoff cap between them
+_WAKE_ATTEMPTS = 6
+_CONNECT_ATTEMPTS = 3
+_RETRY_WAIT = 5
+# Longest single request in either step (health probe and MCP init timeouts)
+_REQUEST_TIMEOUT = 30
+
+# Config screen choice -> (setting key, prompt label)
+_EDITABLE_SETTINGS = {
+    "1": ("MCP_SERVER_URL", "MCP Server URL"),
+    "2": ("MCP_TOKEN", "MCP Token"),
+    "3": ("MCP_HEALTH_URL", "Health Check URL"),
+}
+
 
 def _toggle_verbose():
     """Toggle verbose mode and persist the setting."""
     config.VERBOSE = not config.VERBOSE
-    # Persist to config file
+    # Persist to config file, skipping the rewrite if it already holds this value
+    # (e.g. after the background listener toggled verbose without saving)
+    new_value = "true" if config.VERBOSE else "false"
     cfg = load_config()
-    cfg["VERBOSE"] = str(config.VERBOSE).lower()
-    save_config(cfg)
+    if cfg.get("VERBOSE") != new_value:
+        cfg["VERBOSE"] = new_value
+        save_config(cfg)
     status = "[bold green]ON[/bold green]" if config.VERBOSE else "[bold red]OFF[/bold red]"
     console.print(f"\n[bold cyan]Verbose logging toggled {status}[/bold cyan]\n")
 
 
-def handle_config_command():
+async def handle_config_command():
     """Show current config and allow interactive editing. Loops until user exits. Returns True if any setting changed."""
     changed = False
 
     while True:
-        token_display = (
-            config.MCP_TOKEN[:8] + "..."
-            if config.MCP_TOKEN and len(config.MCP_TOKEN) > 8
-            else config.MCP_TOKEN or "[dim]Not set[/dim]"
+        display_config_settings(
+            config.MCP_SERVER_URL,
+            config.MCP_TOKEN,
+            config.MCP_HEALTH_URL,
+            config.VERBOSE,
+            CONFIG_FILE,
         )
-        verbose_display = "[green]ON[/green]" if config.VERBOSE else "[red]OFF[/red]"
-
-        console.print()
-        console.print("[bold underline]Configuration[/bold underline]")
-        console.print()
-        console.print(
-            f"  [bold cyan]1.[/bold cyan] MCP_SERVER_URL:  {config.MCP_SERVER_URL or '[dim]Not set[/dim]'}"
-        )
-        console.print(f"  [bold cyan]2.[/bold cyan] MCP_TOKEN:       {token_display}")
-        console.print(
-            f"  [bold cyan]3.[/bold cyan] MCP_HEALTH_URL:  {config.MCP_HEALTH_URL or '[dim]Not set[/dim]'}"
-        )
-        console.print(f"  [bold cyan]4.[/bold cyan] VERBOSE:         {verbose_display}")
-        console.print()
-        console.print(f"  [dim]Config file: {CONFIG_FILE}[/dim]")
-        console.print()
 
-        choice = Prompt.ask("Edit setting (1-4) or press Enter to go back").strip()
+        choice = (await aprompt("Edit setting (1-4) or press Enter to go back")).strip()
         if not choice:
             return changed
 
@@ -76,17 +104,11 @@ def handle_config_command():
             _toggle_verbose()
             continue
 
-        keys = {
-            "1": ("MCP_SERVER_URL", "MCP Server URL"),
-            "2": ("MCP_TOKEN", "MCP Token"),
-            "3": ("MCP_HEALTH_URL", "Health Check URL"),
-        }
-
-        if choice not in keys:
+        if choice not in _EDITABLE_SETTINGS:
             console.print("[red]Invalid choice.[/red]")
             continue
 
-        key, label = keys[choice]
+        key, label = _EDITABLE_SETTINGS[choice]
         current = config.get_setting(key) or ""
 
         console.print()
@@ -94,7 +116,7 @@ def handle_config_command():
             display = current[:40] + ("..." if len(current) > 40 else "")
             console.print(f"  [dim]Current: {display}[/dim]")
         console.print("  [dim]Enter new value, 'clear' to remove, or Enter to keep current[/dim]")
-        new_value = input(f"  {label}: ").strip()
+        new_value = (await ainput(f"  {label}: ")).strip()
 
         if not new_value:
             console.print("[dim]  No change.[/dim]")
@@ -107,124 +129,178 @@ def handle_config_command():
             cfg[key] = new_value
 
         if save_config(cfg):
-            reload_config()
+            reload_config(cfg)
             console.print(f"[green]  Updated {key}.[/green]")
             changed = True
         else:
             console.print("[red]  Failed to save setting.[/red]")
 
 
+def _step_deadline(max_attempts: int) -> float:
+    """
+    Return the time.monotonic() deadline for a retried connection step.
+
+    The budget allows each attempt its full request timeout plus the
+    longest backoff after it. Past it no new attempt starts, and health
+    probes are only given what is left, so a step can't outrun it by a
+    final 30 s request.
+    """
+    return time.monotonic() + max_attempts * (_RETRY_WAIT + _REQUEST_TIMEOUT)
+
+
+async def _wait_for_ready(health_url):
+    """
+    Hold the MCP connection back until the woken server reports ready.
+
+    Returns as soon as the readiness probe succeeds, or after its 5 second
+    budget; either way the connection follows, and its retry loop covers a
+    server that is still starting.
+    """
+    from .client import wait_until_ready
+
+    with (
+        vtimed("Readiness wait"),
+        console.status("  [dim]Waiting for server to report ready...[/dim]", spinner="dots"),
+    ):
+        await wait_until_ready(health_url, max_wait=5)
+
+
+def _show_cached_tools(tools):
+    """After a failed connection, list the last known tools so the user can see what was there."""
+    if tools:
+        console.print("[dim]Last known tools for this server (from cache):[/dim]")
+        display_tools(tools)
+
+
 async def reconnect(old_session):
     """Clean up old session and establish a new connection. Returns (mcp_session, tools) or (None, None)."""
+    # Imported here: the MCP client stack is slow to load and --help doesn't need it
+    from .client import connect_and_list_tools, wake_up_server
+
+    health_url = config.MCP_HEALTH_URL
     console.print("[bold cyan]Reconnecting...[/bold cyan]")
-    display_config_panel(config.MCP_SERVER_URL, config.MCP_HEALTH_URL)
+    display_config_panel(config.MCP_SERVER_URL, health_url)
     overall_start = time.monotonic()
 
-    if old_session:
-        try:
-            await old_session.cleanup()
-        except Exception:
-            pass
+    # Tear the old session down in the background while the server wakes up
+    cleanup_task = asyncio.create_task(old_session.cleanup()) if old_session else None
 
-    # Determine total steps
-    total_steps = 2 if config.MCP_HEALTH_URL else 1
-    current_step = 1
+    try:
+        # Determine total steps
+        total_steps = 2 if health_url else 1
+        current_step = 1
 
-    # Step 1: Wake up server if health URL is configured
-    if config.MCP_HEALTH_URL:
-        display_step(current_step, total_steps, "WAKING UP SERVER", "in_progress")
-        wake_start = time.monotonic()
-        is_awake = await wake_up_server(config.MCP_HEALTH_URL, max_attempts=6, wait_seconds=5)
+        # Step 1: Wake up server if health URL is configured
+        if health_url:
+            display_step(current_step, total_steps, "WAKING UP SERVER", "in_progress")
+            with vtimed("Wake-up step"):
+                is_awake = await wake_up_server(
+                    health_url,
+                    max_attempts=_WAKE_ATTEMPTS,
+                    wait_seconds=_RETRY_WAIT,
+                    deadline=_step_deadline(_WAKE_ATTEMPTS),
+                )
 
-        if not is_awake:
-            console.print("[bold red]  Failed to wake up server[/bold red]\n")
-            return None, None
+                if not is_awake:
+                    console.print("[bold red]  Failed to wake up server[/bold red]\n")
+                    return None, None
 
-        display_step(current_step, total_steps, "WAKING UP SERVER", "success", update=True)
-        vlog_timing("Wake-up step", time.monotonic() - wake_start)
+                display_step(current_step, total_steps, "WAKING UP SERVER", "success", update=True)
 
-        with console.status(
-            "  [dim]Waiting for server initialization (5s)...[/dim]", spinner="dots"
-        ):
-            await asyncio.sleep(5)
+            await _wait_for_ready(health_url)
+            console.print()
+            current_step += 1
 
+        # Step 2: Connect and list tools
+        display_step(current_step, total_steps, "CONNECTING AND LISTING TOOLS", "in_progress")
+        with vtimed("Connect+list step"):
+            mcp_session, tools = await connect_and_list_tools(
+                max_attempts=_CONNECT_ATTEMPTS,
+                wait_seconds=_RETRY_WAIT,
+                deadline=_step_deadline(_CONNECT_ATTEMPTS),
+            )
+
+            if not mcp_session:
+                console.print("[bold red]  Failed to connect to MCP server[/bold red]\n")
+                _show_cached_tools(tools)
+                return None, None
+
+            display_step(
+                current_step, total_steps, "CONNECTING AND LISTING TOOLS", "success", update=True
+            )
+        vlog_timing("Total reconnect", time.monotonic() - overall_start)
         console.print()
-        current_step += 1
-
-    # Step 2: Connect and list tools
-    display_step(current_step, total_steps, "CONNECTING AND LISTING TOOLS", "in_progress")
-    connect_start = time.monotonic()
-    mcp_session, tools = await connect_and_list_tools(max_attempts=3, wait_seconds=5)
-
-    if not mcp_session:
-        console.print("[bold red]  Failed to connect to MCP server[/bold red]\n")
-        return None, None
-
-    display_step(current_step, total_steps, "CONNECTING AND LISTING TOOLS", "success", update=True)
-    vlog_timing("Connect+list step", time.monotonic() - connect_start)
-    vlog_timing("Total reconnect", time.monotonic() - overall_start)
-    console.print()
-    console.print(
-        f"[bold green]Connected![/bold green] Server has [bold cyan]{len(tools)}[/bold cyan] tools available"
-    )
-    console.print()
-    return mcp_session, tools
+        console.print(
+            f"[bold green]Connected![/bold green] Server has [bold cyan]{len(tools)}[/bold cyan] tools available"
+        )
+        console.print()
+        return mcp_session, tools
+    finally:
+        if cleanup_task:
+            await asyncio.gather(cleanup_task, return_exceptions=True)
 
 
 async def test_connectivity():
     """Test connectivity to the MCP server."""
+    # Imported here: the MCP client stack is slow to load and --help doesn't need it
+    from .client import connect_and_list_tools, wake_up_server
+
     # Start background listener for 'v' key toggle
     listener_task = asyncio.create_task(listen_for_toggle())
     mcp_session = None
     try:
+        health_url = config.MCP_HEALTH_URL
         display_logo()
-        display_config_panel(config.MCP_SERVER_URL, config.MCP_HEALTH_URL)
+        display_config_panel(config.MCP_SERVER_URL, health_url)
         overall_start = time.monotonic()
 
         # Determine total steps
-        total_steps = 2 if config.MCP_HEALTH_URL else 1
+        total_steps = 2 if health_url else 1
         current_step = 1
 
         # Step 1: Wake up server if health URL is configured
-        if config.MCP_HEALTH_URL:
+        if health_url:
             display_step(current_step, total_steps, "WAKING UP SERVER", "in_progress")
-            wake_start = time.monotonic()
-            is_awake = await wake_up_server(config.MCP_HEALTH_URL, max_attempts=6, wait_seconds=5)
-
-            if not is_awake:
-                console.print("[bold red]  Failed to wake up server[/bold red]\n")
-                return
+            with vtimed("Wake-up step"):
+                is_awake = await wake_up_server(
+                    health_url,
+                    max_attempts=_WAKE_ATTEMPTS,
+                    wait_seconds=_RETRY_WAIT,
+                    deadline=_step_deadline(_WAKE_ATTEMPTS),
+                )
 
-            display_step(current_step, total_steps, "WAKING UP SERVER", "success", update=True)
-            vlog_timing("Wake-up step", time.monotonic() - wake_start)
+                if not is_awake:
+                    console.print("[bold red]  Failed to wake up server[/bold red]\n")
+                    return
 
-            # Wait for MCP server to initialize (shorter wait like working example)
-            with console.status(
-                "  [dim]Waiting for server initialization (5s)...[/dim]", spinner="dots"
-            ):
-                await asyncio.sleep(5)
+                display_step(current_step, total_steps, "WAKING UP SERVER", "success", update=True)
 
+            await _wait_for_ready(health_url)
             console.print()
             current_step += 1
 
         # Step 2: Connect to MCP server AND list tools in one operation
         # (This avoids session expiry between connect and list_tools)
         display_step(current_step, total_steps, "CONNECTING AND LISTING TOOLS", "in_progress")
-        connect_start = time.monotonic()
-        mcp_session, tools = await connect_and_list_tools(max_attempts=3, wait_seconds=5)
+        with vtimed("Connect+list step"):
+            mcp_session, tools = await connect_and_list_tools(
+                max_attempts=_CONNECT_ATTEMPTS,
+                wait_seconds=_RETRY_WAIT,
+                deadline=_step_deadline(_CONNECT_ATTEMPTS),
+            )
 
-        if not mcp_session:
-            console.print("[bold red]  Failed to connect to MCP server[/bold red]\n")
-            console.print("[yellow]This may indicate:[/yellow]")
-            console.print("  - The MCP server is not properly configured")
-            console.print("  - The server endpoint URL is incorrect")
-            console.print("  - The server is returning errors for MCP requests")
-            return
+            if not mcp_session:
+                console.print("[bold red]  Failed to connect to MCP server[/bold red]\n")
+                console.print("[yellow]This may indicate:[/yellow]")
+                console.print("  - The MCP server is not properly configured")
+                console.print("  - The server endpoint URL is incorrect")
+                console.print("  - The server is returning errors for MCP requests")
+                _show_cached_tools(tools)
+                return
 
-        display_step(
-            current_step, total_steps, "CONNECTING AND LISTING TOOLS", "success", update=True
-        )
-        vlog_timing("Connect+list step", time.monotonic() - connect_start)
+            display_step(
+                current_step, total_steps, "CONNECTING AND LISTING TOOLS", "success", update=True
+            )
         vlog_timing("Total test time", time.monotonic() - overall_start)
         console.print()
         console.print(
@@ -244,6 +320,15 @@ async def test_connectivity():
             await mcp_session.cleanup()
 
 
+async def _reconnect_or_keep(mcp_session, tools):
+    """Reconnect after a config change, falling back to the current session on failure."""
+    new_session, new_tools = await reconnect(mcp_session)
+    if new_session:
+        return new_session, new_tools
+    console.print("[yellow]Reconnection failed. Keeping current connection.[/yellow]\n")
+    return mcp_session, tools
+
+
 async def interactive_session():
     """Run an interactive session to explore and test MCP tools."""
     # Start background listener for 'v' key toggle during setup
@@ -257,7 +342,14 @@ async def interactive_session():
         # Check config, run wizard if needed
         if not validate_config():
             if is_first_run():
-                run_first_time_setup()
+                # The wizard reads stdin itself, so keep the 'v' listener off it meanwhile
+                listener_task.cancel()
+                try:
+                    await listener_task
+                except asyncio.CancelledError:
+                    pass
+                await run_first_time_setup()
+                listener_task = asyncio.create_task(listen_for_toggle())
             else:
                 console.print("[bold red]Configuration incomplete.[/bold red]")
                 console.print("MCP_SERVER_URL and MCP_TOKEN are required.")
@@ -293,38 +385,36 @@ async def interactive_session():
         while running:
             display_tools(tools)
 
-            console.print("[bold underline]Commands:[/bold underline]")
-            console.print("  [bold cyan]number[/bold cyan] - Select a tool")
-            console.print(
-                "  [bold cyan]v[/bold cyan]      - Toggle verbose logging (current: {})".format(
-                    "[green]ON[/green]" if config.VERBOSE else "[red]OFF[/red]"
-                )
-            )
-            console.print("  [bold cyan]c[/bold cyan]      - Configuration settings")
-            console.print("  [bold cyan]q[/bold cyan]      - Quit")
-            console.print()
+            display_command_menu(config.VERBOSE)
 
-            choice = Prompt.ask("Select tool").strip().lower()
+            choice = (await aprompt("Select tool")).strip().lower()
+            command = _TOOL_LIST_COMMANDS.get(choice)
 
-            if choice in ("quit", "q", "exit"):
+            if command == "quit":
                 console.print("\n[bold yellow]Exiting...[/bold yellow]")
                 break
 
-            if choice == "v":
+            if command == "verbose":
                 _toggle_verbose()
                 continue
 
-            if choice == "c":
-                changed = handle_config_command()
-                if changed:
-                    new_session, new_tools = await reconnect(mcp_session)
-                    if new_session:
-                        mcp_session = new_session
-                        tools = new_tools
-                    else:
-                        console.print(
-                            "[yellow]Reconnection failed. Keeping current connection.[/yellow]\n"
-                        )
+            if command == "config":
+                if await handle_config_command():
+                    mcp_session, tools = await _reconnect_or_keep(mcp_session, tools)
+                continue
+
+            # Comma-separated tool numbers run as one concurrent batch
+            if "," in choice:
+                try:
+                    numbers = [int(part) for part in choice.split(",") if part.strip()]
+                except ValueError:
+                    numbers = []
+                if numbers and all(1 <= n <= len(tools) for n in numbers):
+                    await call_tools_batch(mcp_session, [tools[n - 1] for n in numbers])
+                else:
+                    console.print(
+                        f"[red]Invalid batch. Enter tool numbers between 1 and {len(tools)}, e.g. 1,3[/red]\n"
+                    )
                 continue
 
             # Try to parse as tool number
@@ -338,41 +428,34 @@ async def interactive_session():
                         display_tool_header(selected_tool)
                         display_tool_menu()
 
-                        tool_choice = Prompt.ask("Choose option").strip().lower()
+                        tool_choice = (await aprompt("Choose option")).strip().lower()
+                        action = _TOOL_VIEW_COMMANDS.get(tool_choice)
 
-                        if tool_choice in ("d", "details", "1"):
+                        if action == "details":
                             # View details
                             display_tool_schema(selected_tool)
 
-                        elif tool_choice in ("r", "run", "2"):
+                        elif action == "run":
                             # Run tool
-                            params = get_tool_parameters(selected_tool)
+                            params = await get_tool_parameters(selected_tool)
                             await call_tool(mcp_session, selected_tool, params)
 
-                        elif tool_choice in ("b", "back", "3"):
+                        elif action == "back":
                             # Back to tool list
                             break
 
-                        elif tool_choice in ("q", "quit", "exit"):
+                        elif action == "quit":
                             # Quit entirely
                             console.print("\n[bold yellow]Exiting...[/bold yellow]")
                             running = False
                             break
 
-                        elif tool_choice == "v":
+                        elif action == "verbose":
                             _toggle_verbose()
 
-                        elif tool_choice == "c":
-                            changed = handle_config_command()
-                            if changed:
-                                new_session, new_tools = await reconnect(mcp_session)
-                                if new_session:
-                                    mcp_session = new_session
-                                    tools = new_tools
-                                else:
-                                    console.print(
-                                        "[yellow]Reconnection failed. Keeping current connection.[/yellow]\n"
-                                    )
+                        elif action == "config":
+                            if await handle_config_command():
+                                mcp_session, tools = await _reconnect_or_keep(mcp_session, tools)
                                 break  # Back to tool list since tools may have changed
 
                         else:
@@ -400,43 +483,75 @@ async def interactive_session():
             await mcp_session.cleanup()
 
 
+async def _run_config_wizard():
+    display_logo()
+    await run_first_time_setup()
+
+
+async def _show_help():
+    display_logo()
+    display_help(CONFIG_FILE)
+
+
+# Command line flag -> handler; anything else runs the interactive session
+_FLAG_HANDLERS = {
+    "--test": test_connectivity,
+    "-t": test_connectivity,
+    "--config": _run_config_wizard,
+    "-c": _run_config_wizard,
+    "--help": _show_help,
+    "-h": _show_help,
+}
+
+
+def _preload_client_module():
+    """
+    Start importing the MCP client stack on a daemon thread.
+
+    It takes about a second to load. Starting it once we know the command
+    will connect overlaps that with the logo, the config check and the setup
+    wizard; the first `from .client import ...` then waits for it to finish.
+    """
+
+    def _load():
+        try:
+            importlib.import_module(f"{__package__}.client")
+        except Exception:
+            # The import on the main path raises it again with a proper traceback
+            pass
+
+    threading.Thread(target=_load, name="forbin-preload", daemon=True).start()
+
+
 async def async_main():
     """Async main entry point."""
     setup_logging()
 
     try:
         # Check for command line arguments
-        if len(sys.argv) > 1:
-            if sys.argv[1] in ("--test", "-t"):
-                await test_connectivity()
-                return
-            elif sys.argv[1] in ("--config", "-c"):
-                display_logo()
-                run_first_time_setup()
-                return
-            elif sys.argv[1] in ("--help", "-h"):
-                display_logo()
-                console.print("\n[bold]Usage:[/bold]")
-                console.print("  forbin            Run interactive session")
-                console.print("  forbin --test     Test connectivity only")
-                console.print("  forbin --config   Run configuration wizard")
-                console.print("  forbin --help     Show this help message")
-                console.print("\n[bold]Configuration:[/bold]")
-                console.print(f"  Config file: {CONFIG_FILE}")
-                console.print("  Settings can also be set via .env file or environment variables")
-                console.print("  Priority: .env / environment > ~/.forbin/config.json")
-                console.print("\n[bold]Interactive Shortcuts:[/bold]")
-                console.print("  [bold cyan]'v'[/bold cyan]   - Toggle verbose logging at any time")
-                console.print("  [bold cyan]'c'[/bold cyan]   - View/update configuration")
-                console.print("  [bold cyan]ESC[/bold cyan]   - Cancel a running tool call")
-                return
+        flag = sys.argv[1] if len(sys.argv) > 1 else None
+        handler = _FLAG_HANDLERS.get(flag)
+        if handler is None or handler is test_connectivity:
+            _preload_client_module()
+        if handler:
+            await handler()
+            return
 
         # Run interactive session by default
         await interactive_session()
     except asyncio.CancelledError:
         pass
+    finally:
+        # Only tear down the shared HTTP client if the client module was ever loaded
+        client_module = sys.modules.get(f"{__package__}.client")
+        if client_module is not None:
+            await client_module.close_http_client()
 
 
 def main():
     """Synchronous entry point for CLI."""
-    asyncio.run(async_main())
+    loop_thread = AsyncLoopThread()
+    try:
+        loop_thread.run(async_main())
+    finally:
+        loop_thread.stop()
@@ -1,14 +1,69 @@
 import asyncio
+import os
+import random
+import socket
 import time
-from typing import Optional
+import traceback
+from typing import Any, Awaitable, Callable, Optional, TypeVar
 import httpx
 from fastmcp.client import Client
 from fastmcp.client.auth import BearerAuth
 
 from . import config
 from .display import console
+from .retry import backoff_delay
+from .tool_cache import load_cached_tools, save_tools
 from .verbose import vlog, vlog_json, vlog_timing, vtimer
 
+T = TypeVar("T")
+
+
+def _env_seconds(name: str, default: float) -> float:
+    try:
+        return max(0.0, float(os.getenv(name, default)))
+    except ValueError:
+        return default
+
+
+# How long a successful wake-up is trusted, so back-to-back wake-ups of the
+# same server (e.g. a reconnect right after connecting) skip the probes.
+# FORBIN_HEALTH_TTL=0 disables it.
+_HEALTH_TTL = _env_seconds("FORBIN_HEALTH_TTL", 10.0)
+
+# health URL -> monotonic time until which it is known to be awake
+_health_cache: dict[str, float] = {}
+
+# When set, a saved tool list younger than this many seconds is used instead
+# of asking the server again. Off by default: the list can change between runs.
+_TOOLS_CACHE_TTL = _env_seconds("FORBIN_TOOLS_CACHE_TTL", 0.0)
+
+# Shared HTTP client for health probes. Reusing it keeps TCP/TLS connections
+# alive across wake-up attempts, readiness polls and reconnects.
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared httpx client, creating it on first use."""
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(
+            timeout=10.0,
+            # httpx's default 5s keep-alive expiry equals the gap between wake-up
+            # attempts, so idle connections would be dropped just before reuse
+            limits=httpx.Limits(
+                max_keepalive_connections=8, max_connections=16, keepalive_expiry=60.0
+            ),
+        )
+    return _http_client
+
+
+async def close_http_client():
+    """Close the shared httpx client if it was created."""
+    global _http_client
+    if _http_client is not None:
+        client, _http_client = _http_client, None
+        await client.aclose()
+
 
 class MCPSession:
     """Wrapper to hold both the client and session for proper lifecycle management."""
@@ -31,15 +86,18 @@ class MCPSession:
         vlog_json("Request Arguments", arguments)
         async with vtimer("Tool execution time"):
             result = await self.session.call_tool(name, arguments)
-        vlog(
-            f"Response: is_error={result.is_error}, "
-            f"content_blocks={len(result.content) if result.content else 0}"
-        )
-        if config.VERBOSE and result.content:
-            for i, block in enumerate(result.content):
-                text = getattr(block, "text", None)
-                if text:
-                    vlog_json(f"Raw Response Block {i}", text)
+        if not config.VERBOSE:
+            # Everything below only builds verbose output
+            return result
+
+        content = result.content or []
+        vlog(f"Response: is_error={result.is_error}, content_blocks={len(content)}")
+        texts = [text for block in content if (text := getattr(block, "text", None))]
+        if len(texts) == 1:
+            vlog_json("Raw Response Block 0", texts[0])
+        elif texts:
+            # One panel for all blocks instead of a highlighted panel per block
+            vlog_json(f"Raw Response ({len(texts)} blocks)", "\n".join(texts))
         return result
 
     async def cleanup(self):
@@ -52,15 +110,58 @@ class MCPSession:
                 pass
 
 
-async def wake_up_server(health_url: str, max_attempts: int = 6, wait_seconds: float = 5) -> bool:
+async def _probe_health(
+    client: httpx.AsyncClient, health_url: str, attempt: int, timeout: float = 30.0
+):
+    """Issue one health GET. Returns (attempt, response or exception, elapsed seconds)."""
+    attempt_start = time.monotonic()
+    try:
+        outcome = await client.get(health_url, timeout=timeout)
+    except Exception as e:
+        outcome = e
+    return attempt, outcome, time.monotonic() - attempt_start
+
+
+def _remaining(deadline: Optional[float]) -> Optional[float]:
+    """Seconds left before a time.monotonic() deadline, or None if there is none."""
+    return None if deadline is None else deadline - time.monotonic()
+
+
+def _clamp(wait: Optional[float], remaining: Optional[float]) -> Optional[float]:
+    """Shorten a wait (None = unbounded) so it ends by the deadline."""
+    if remaining is None:
+        return wait
+    remaining = max(0.0, remaining)
+    return remaining if wait is None else min(wait, remaining)
+
+
+async def wake_up_server(
+    health_url: str,
+    max_attempts: int = 6,
+    wait_seconds: float = 5,
+    client: Optional[httpx.AsyncClient] = None,
+    max_in_flight: int = 2,
+    deadline: Optional[float] = None,
+) -> bool:
     """
     Wake up a suspended server by calling the health endpoint.
     Useful for Fly.io and other platforms that suspend inactive services.
 
+    Attempts are staggered rather than strictly sequential: new probes are
+    launched on a jittered exponential backoff (1s, 2s, 4s, ... up to
+    wait_seconds) even while earlier ones are still waiting on a cold
+    server, and the first 200 wins (the rest are cancelled). At most
+    max_in_flight probes are outstanding at once, so a suspended instance
+    isn't hammered with a pile of hung requests.
+
     Args:
         health_url: The health endpoint URL
         max_attempts: Maximum number of health check attempts
-        wait_seconds: Seconds to wait between attempts
+        wait_seconds: Upper bound on the gap between attempt launches
+        client: httpx client to use (defaults to the shared pooled client)
+        max_in_flight: Maximum number of probes outstanding at once
+        deadline: time.monotonic() value after which no probe is started or
+            waited on; probes are given no longer than what is left
 
     Returns:
         True if server is awake, False otherwise
@@ -68,129 +169,334 @@ async def wake_up_server(health_url: str, max_attempts: int = 6, wait_seconds: f
     vlog(f"Wake-up target: [bold]{health_url}[/bold]")
     wake_start = time.monotonic()
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
+    if _health_cache.get(health_url, 0.0) > wake_start:
+        vlog("Server answered a wake-up moments ago; skipping health probes")
+        return True
+
+    client = client or get_http_client()
+    in_flight: set[asyncio.Task] = set()
+    launched = 0
+    next_launch = wake_start
+
+    try:
         with console.status("  [dim]Polling health endpoint...[/dim]", spinner="dots") as status:
-            for attempt in range(1, max_attempts + 1):
-                try:
-                    status.update(f"  [dim]Attempt {attempt}/{max_attempts}...[/dim]")
-                    attempt_start = time.monotonic()
-                    response = await client.get(health_url)
-                    attempt_elapsed = time.monotonic() - attempt_start
-
-                    vlog(
-                        f"Attempt {attempt}/{max_attempts}: "
-                        f"HTTP {response.status_code} ({attempt_elapsed * 1000:.0f}ms)"
+            while launched < max_attempts or in_flight:
+                remaining = _remaining(deadline)
+                if remaining is not None and remaining <= 0:
+                    console.print("  [yellow]Gave up: wake-up time budget used[/yellow]")
+                    break
+
+                can_launch = launched < max_attempts and len(in_flight) < max_in_flight
+                if can_launch and time.monotonic() >= next_launch:
+                    launched += 1
+                    status.update(f"  [dim]Attempt {launched}/{max_attempts}...[/dim]")
+                    probe_timeout = 30.0 if remaining is None else min(30.0, remaining)
+                    in_flight.add(
+                        asyncio.create_task(
+                            _probe_health(client, health_url, launched, probe_timeout)
+                        )
                     )
+                    next_launch = time.monotonic() + backoff_delay(launched, cap=wait_seconds)
+
+                if not in_flight:
+                    # Last attempt failed fast; wait out the gap, then launch the next one
+                    await asyncio.sleep(_clamp(max(0.0, next_launch - time.monotonic()), remaining))
+                    next_launch = time.monotonic()
+                    continue
+
+                # With a probe slot free, wake up for the next launch; otherwise wait for a result
+                timeout = (
+                    max(0.0, next_launch - time.monotonic())
+                    if launched < max_attempts and len(in_flight) < max_in_flight
+                    else None
+                )
+                done, in_flight = await asyncio.wait(
+                    in_flight,
+                    timeout=_clamp(timeout, remaining),
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
 
-                    if response.status_code == 200:
-                        vlog_timing("Total wake-up time", time.monotonic() - wake_start)
-                        return True
-                    else:
-                        if attempt == max_attempts:
+                for i, task in enumerate(done, 1):
+                    attempt, outcome, attempt_elapsed = task.result()
+                    # Only the final outcome is reported unless verbose
+                    is_last = launched == max_attempts and not in_flight and i == len(done)
+
+                    if not isinstance(outcome, Exception):
+                        vlog(
+                            f"Attempt {attempt}/{max_attempts}: "
+                            f"HTTP {outcome.status_code} ({attempt_elapsed * 1000:.0f}ms)"
+                        )
+                        if outcome.status_code == 200:
+                            vlog_timing("Total wake-up time", time.monotonic() - wake_start)
+                            if _HEALTH_TTL:
+                                _health_cache[health_url] = time.monotonic() + _HEALTH_TTL
+                            return True
+                        if is_last:
                             console.print(
-                                f"  [yellow]Server responded with status {response.status_code}[/yellow]"
+                                f"  [yellow]Server responded with status {outcome.status_code}[/yellow]"
                             )
+                    elif isinstance(outcome, (httpx.ConnectError, httpx.TimeoutException)):
+                        vlog(f"Attempt {attempt}/{max_attempts}: {type(outcome).__name__}")
+                        if config.VERBOSE or is_last:
+                            error_msg = (
+                                f"  [yellow]Connection failed: {type(outcome).__name__}[/yellow]"
+                            )
+                            if config.VERBOSE:
+                                error_msg += f" [dim]({str(outcome)})[/dim]"
+                            console.print(error_msg)
+                    else:
+                        vlog(
+                            f"Attempt {attempt}/{max_attempts}: {type(outcome).__name__}: {outcome}"
+                        )
+                        if config.VERBOSE or is_last:
+                            console.print(f"  [red]Unexpected error: {outcome}[/red]")
+    finally:
+        for task in in_flight:
+            task.cancel()
+        if in_flight:
+            await asyncio.gather(*in_flight, return_exceptions=True)
 
-                except (httpx.ConnectError, httpx.TimeoutException) as e:
-                    vlog(f"Attempt {attempt}/{max_attempts}: {type(e).__name__}")
-                    if config.VERBOSE or attempt == max_attempts:
-                        error_msg = f"  [yellow]Connection failed: {type(e).__name__}[/yellow]"
-                        if config.VERBOSE:
-                            error_msg += f" [dim]({str(e)})[/dim]"
-                        console.print(error_msg)
-                except Exception as e:
-                    vlog(f"Attempt {attempt}/{max_attempts}: {type(e).__name__}: {e}")
-                    if config.VERBOSE or attempt == max_attempts:
-                        console.print(f"  [red]Unexpected error: {e}[/red]")
+    vlog_timing("Total wake-up time (failed)", time.monotonic() - wake_start)
+    return False
 
-                if attempt < max_attempts:
-                    await asyncio.sleep(wait_seconds)
 
-    vlog_timing("Total wake-up time (failed)", time.monotonic() - wake_start)
+# Health-body "status" values that mean the process is up but not serving yet
+_NOT_READY_STATUSES = ("starting", "initializing", "not_ready", "unready", "down")
+
+
+def _reports_ready(response: httpx.Response) -> bool:
+    """Return False only if a JSON health body explicitly reports not-ready."""
+    try:
+        body = response.json()
+    except Exception:
+        return True
+    if not isinstance(body, dict):
+        return True
+    status = body.get("status")
+    if isinstance(status, str) and status.lower() in _NOT_READY_STATUSES:
+        return False
+    return body.get("ready") is not False
+
+
+async def wait_until_ready(
+    health_url: str,
+    max_wait: float = 20,
+    initial: float = 0.25,
+    client: Optional[httpx.AsyncClient] = None,
+) -> bool:
+    """
+    Poll the health endpoint until the server reports ready.
+
+    Replaces a fixed post-wake sleep: returns as soon as the server answers
+    200 without a not-ready status in its body (e.g. {"status": "starting"}),
+    backing off between probes up to the max_wait budget. Each delay is
+    jittered so several clients waking the same server don't probe in lockstep.
+
+    Args:
+        health_url: The health endpoint URL
+        max_wait: Maximum total seconds to wait
+        initial: Base delay after the first failed probe (grows 1.5x, capped at 1s)
+        client: httpx client to use (defaults to the shared pooled client)
+
+    Returns:
+        True if the server responded ready within max_wait, False otherwise
+    """
+    vlog(f"Readiness probe: [bold]{health_url}[/bold]")
+    start = time.monotonic()
+    delay = initial
+
+    client = client or get_http_client()
+
+    while True:
+        try:
+            response = await client.get(health_url, timeout=2.0)
+            vlog(f"Readiness probe: HTTP {response.status_code}")
+            if response.status_code == 200 and _reports_ready(response):
+                vlog_timing("Server ready after", time.monotonic() - start)
+                return True
+        except (httpx.ConnectError, httpx.RemoteProtocolError, httpx.TimeoutException) as e:
+            vlog(f"Readiness probe: {type(e).__name__}")
+
+        remaining = max_wait - (time.monotonic() - start)
+        if remaining <= 0:
+            break
+        await asyncio.sleep(min(delay * random.uniform(0.5, 1.0), remaining))
+        delay = min(delay * 1.5, 1.0)
+
+    vlog_timing("Readiness probe gave up after", time.monotonic() - start)
     return False
 
 
-async def connect_to_mcp_server(
-    max_attempts: int = 3, wait_seconds: float = 5
-) -> Optional[MCPSession]:
+def _new_client(server_url: str, auth: BearerAuth) -> Client:
+    """Create an MCP client. A fresh one is needed per attempt since a failed enter can't be retried."""
+    return Client(
+        server_url,
+        auth=auth,
+        init_timeout=30.0,  # Extended timeout for cold starts
+        timeout=600.0,  # Wait up to 10 minutes for tool operations
+    )
+
+
+# Errors raised while the server is still coming up; reported without a traceback
+_TRANSIENT_ERRORS = frozenset({"BrokenResourceError", "ClosedResourceError"})
+
+
+def _report_attempt_error(e: Exception, attempt: int, max_attempts: int):
+    """Log a failed connection attempt; only the last one is shown unless verbose."""
+    error_name = type(e).__name__
+    vlog(f"Attempt {attempt}/{max_attempts}: {error_name}: {e}")
+    if not (config.VERBOSE or attempt == max_attempts):
+        return
+    if error_name in _TRANSIENT_ERRORS:
+        console.print("  [yellow]Connection error (server not ready)[/yellow]")
+        return
+    console.print(f"  [red]{error_name}: {e}[/red]")
+    if config.VERBOSE:
+        console.print(f"[dim]{traceback.format_exc()}[/dim]")
+
+
+def _iter_causes(e: BaseException):
+    """Yield e, the exceptions it was raised from, and the members of exception groups."""
+    stack, seen = [e], set()
+    while stack:
+        exc = stack.pop()
+        if id(exc) in seen:
+            continue
+        seen.add(id(exc))
+        yield exc
+        if isinstance(exc, BaseExceptionGroup):
+            stack.extend(exc.exceptions)
+        if exc.__cause__ is not None:
+            stack.append(exc.__cause__)
+        elif exc.__context__ is not None and not exc.__suppress_context__:
+            stack.append(exc.__context__)
+
+
+# Resolver messages for a host that does not exist (Linux, macOS). httpx keeps
+# only the message of the underlying socket.gaierror, not the error itself.
+_UNKNOWN_HOST = ("Name or service not known", "nodename nor servname provided")
+
+
+def _fatal_connect_hint(e: Exception) -> Optional[str]:
     """
-    Connect to the MCP server with retry logic.
+    Return a remediation hint if the error can't be fixed by retrying, else None.
+
+    Rejected credentials, unresolvable host names and malformed URLs fail
+    the same way on every attempt, so retrying only delays the message.
+    """
+    for exc in _iter_causes(e):
+        if isinstance(exc, httpx.HTTPStatusError) and exc.response.status_code in (401, 403):
+            return f"Server rejected the token (HTTP {exc.response.status_code}); check MCP_TOKEN"
+        if (isinstance(exc, socket.gaierror) and exc.errno != socket.EAI_AGAIN) or (
+            isinstance(exc, httpx.ConnectError) and any(m in str(exc) for m in _UNKNOWN_HOST)
+        ):
+            return "Could not resolve the server's host name; check MCP_SERVER_URL"
+        if isinstance(exc, (httpx.InvalidURL, httpx.UnsupportedProtocol)):
+            return "MCP_SERVER_URL is not a valid http(s) URL"
+    return None
+
+
+async def _retry_connect(
+    attempt_fn: Callable[[Client, int, Any], Awaitable[T]],
+    max_attempts: int,
+    wait_seconds: float,
+    deadline: Optional[float] = None,
+) -> Optional[T]:
+    """
+    Run a connection attempt against a fresh client until one succeeds.
+
+    Timeouts and errors are reported, the partially entered client is
+    closed, and the loop backs off before the next attempt. Errors that no
+    retry can fix (rejected token, unknown host, bad URL) end it at once.
 
     Args:
+        attempt_fn: Coroutine taking (client, attempt, status) and returning the result
         max_attempts: Maximum connection attempts
-        wait_seconds: Seconds to wait between attempts
+        wait_seconds: Upper bound on the backoff between attempts
+        deadline: time.monotonic() value after which no new attempt is started
 
     Returns:
-        MCPSession instance or None if failed
+        The first successful attempt's result, or None if every attempt failed
     """
     server_url = config.MCP_SERVER_URL or ""
-    token = config.MCP_TOKEN or ""
+    # Built once: the auth header is the same for every retry
+    auth = BearerAuth(token=config.MCP_TOKEN or "")
 
     vlog(f"Connecting to: [bold]{server_url}[/bold]")
 
     with console.status("  [dim]Establishing connection...[/dim]", spinner="dots") as status:
         for attempt in range(1, max_attempts + 1):
+            if attempt > 1 and deadline is not None and time.monotonic() >= deadline:
+                console.print("  [yellow]Gave up: connection time budget used[/yellow]")
+                break
+
             client = None
+            hint = None
             try:
                 status.update(f"  [dim]Attempt {attempt}/{max_attempts}...[/dim]")
-                attempt_start = time.monotonic()
-
-                client = Client(
-                    server_url,
-                    auth=BearerAuth(token=token),
-                    init_timeout=30.0,  # Extended timeout for cold starts
-                    timeout=600.0,  # Wait up to 10 minutes for tool operations
-                )
-
-                # Enter the client context and capture the session
-                session = await client.__aenter__()
-
-                vlog_timing(f"Connection attempt {attempt}", time.monotonic() - attempt_start)
-                return MCPSession(client, session)
+                client = _new_client(server_url, auth)
+                return await attempt_fn(client, attempt, status)
 
             except asyncio.TimeoutError:
                 vlog(f"Attempt {attempt}/{max_attempts}: Timeout")
                 if config.VERBOSE or attempt == max_attempts:
                     console.print("  [red]Timeout (server not responding)[/red]")
-                # Clean up partial connection
-                if client:
-                    try:
-                        await client.__aexit__(None, None, None)
-                    except Exception:
-                        pass
-                if attempt < max_attempts:
-                    await asyncio.sleep(wait_seconds)
             except Exception as e:
-                error_name = type(e).__name__
-                vlog(f"Attempt {attempt}/{max_attempts}: {error_name}: {e}")
-                if config.VERBOSE or attempt == max_attempts:
-                    if "BrokenResourceError" in error_name or "ClosedResourceError" in error_name:
-                        console.print("  [yellow]Connection error (server not ready)[/yellow]")
-                    else:
-                        console.print(f"  [red]{error_name}: {e}[/red]")
-
-                    if config.VERBOSE and not (
-                        "BrokenResourceError" in error_name or "ClosedResourceError" in error_name
-                    ):
-                        import traceback
+                hint = _fatal_connect_hint(e)
+                if hint is None:
+                    _report_attempt_error(e, attempt, max_attempts)
+                else:
+                    vlog(f"Attempt {attempt}/{max_attempts}: {type(e).__name__}: {e}")
+                    console.print(f"  [red]{hint}[/red]")
 
-                        console.print(f"[dim]{traceback.format_exc()}[/dim]")
+            # Clean up partial connection
+            if client:
+                try:
+                    await client.__aexit__(None, None, None)
+                except Exception:
+                    pass
 
-                # Clean up partial connection
-                if client:
-                    try:
-                        await client.__aexit__(None, None, None)
-                    except Exception:
-                        pass
+            if hint is not None:
+                # Retrying can't fix this one
+                break
 
-                if attempt < max_attempts:
-                    await asyncio.sleep(wait_seconds)
+            if attempt < max_attempts:
+                await asyncio.sleep(
+                    _clamp(backoff_delay(attempt, cap=wait_seconds), _remaining(deadline))
+                )
 
     return None
 
 
+async def connect_to_mcp_server(
+    max_attempts: int = 3, wait_seconds: float = 5, deadline: Optional[float] = None
+) -> Optional[MCPSession]:
+    """
+    Connect to the MCP server with retry logic.
+
+    Args:
+        max_attempts: Maximum connection attempts
+        wait_seconds: Upper bound on the backoff between attempts
+        deadline: time.monotonic() value after which no new attempt is started
+
+    Returns:
+        MCPSession instance or None if failed
+    """
+
+    async def _attempt(client: Client, attempt: int, status: Any) -> MCPSession:
+        attempt_start = time.monotonic()
+
+        # Enter the client context and capture the session
+        session = await client.__aenter__()
+
+        vlog_timing(f"Connection attempt {attempt}", time.monotonic() - attempt_start)
+        return MCPSession(client, session)
+
+    return await _retry_connect(_attempt, max_attempts, wait_seconds, deadline)
+
+
 async def connect_and_list_tools(
-    max_attempts: int = 3, wait_seconds: float = 5
+    max_attempts: int = 3, wait_seconds: float = 5, deadline: Optional[float] = None
 ) -> tuple[Optional[MCPSession], list]:
     """
     Connect to MCP server AND list tools in a single retry loop.
@@ -200,85 +506,54 @@ async def connect_and_list_tools(
 
     Args:
         max_attempts: Maximum connection attempts
-        wait_seconds: Seconds to wait between attempts
+        wait_seconds: Upper bound on the backoff between attempts
+        deadline: time.monotonic() value after which no new attempt is started
+
+    With FORBIN_TOOLS_CACHE_TTL set, a saved list younger than that is
+    returned after connecting, without a list_tools round trip.
 
     Returns:
-        Tuple of (MCPSession instance or None, list of tools)
+        Tuple of (MCPSession instance or None, list of tools). When every
+        attempt fails, the tools are the last known list for this server
+        (or empty if there is none).
     """
     server_url = config.MCP_SERVER_URL or ""
-    token = config.MCP_TOKEN or ""
-
-    vlog(f"Connecting to: [bold]{server_url}[/bold]")
     total_start = time.monotonic()
+    fresh_tools = (
+        load_cached_tools(server_url, max_age=_TOOLS_CACHE_TTL) if _TOOLS_CACHE_TTL else []
+    )
 
-    with console.status("  [dim]Establishing connection...[/dim]", spinner="dots") as status:
-        for attempt in range(1, max_attempts + 1):
-            client = None
-            try:
-                status.update(f"  [dim]Attempt {attempt}/{max_attempts}...[/dim]")
-                attempt_start = time.monotonic()
-
-                client = Client(
-                    server_url,
-                    auth=BearerAuth(token=token),
-                    init_timeout=30.0,  # Extended timeout for cold starts
-                    timeout=600.0,  # Wait up to 10 minutes for tool operations
-                )
-
-                # Enter the client context and capture the session
-                session = await client.__aenter__()
-                mcp_session = MCPSession(client, session)
+    async def _attempt(client: Client, attempt: int, status: Any) -> tuple[MCPSession, list]:
+        attempt_start = time.monotonic()
 
-                vlog_timing(f"Connection attempt {attempt}", time.monotonic() - attempt_start)
+        # Enter the client context and capture the session
+        session = await client.__aenter__()
+        mcp_session = MCPSession(client, session)
 
-                # Immediately list tools while session is fresh
-                status.update(
-                    f"  [dim]Retrieving tools (attempt {attempt}/{max_attempts})...[/dim]"
-                )
-                list_start = time.monotonic()
-                tools = await asyncio.wait_for(mcp_session.session.list_tools(), timeout=15.0)
-                vlog_timing("Tool listing", time.monotonic() - list_start)
-                vlog(f"Received [bold cyan]{len(tools)}[/bold cyan] tools")
-                vlog_timing("Total connect+list", time.monotonic() - total_start)
+        vlog_timing(f"Connection attempt {attempt}", time.monotonic() - attempt_start)
 
-                return mcp_session, tools
+        if fresh_tools:
+            vlog(f"Using cached tool list ([bold cyan]{len(fresh_tools)}[/bold cyan] tools)")
+            return mcp_session, fresh_tools
 
-            except asyncio.TimeoutError:
-                vlog(f"Attempt {attempt}/{max_attempts}: Timeout")
-                if config.VERBOSE or attempt == max_attempts:
-                    console.print("  [red]Timeout (server not responding)[/red]")
-                # Clean up partial connection
-                if client:
-                    try:
-                        await client.__aexit__(None, None, None)
-                    except Exception:
-                        pass
-                if attempt < max_attempts:
-                    await asyncio.sleep(wait_seconds)
-            except Exception as e:
-                error_name = type(e).__name__
-                vlog(f"Attempt {attempt}/{max_attempts}: {error_name}: {e}")
-                if config.VERBOSE or attempt == max_attempts:
-                    if "BrokenResourceError" in error_name or "ClosedResourceError" in error_name:
-                        console.print("  [yellow]Connection error (server not ready)[/yellow]")
-                    else:
-                        console.print(f"  [red]{error_name}: {e}[/red]")
-
-                    if config.VERBOSE and not (
-                        "BrokenResourceError" in error_name or "ClosedResourceError" in error_name
-                    ):
-                        import traceback
-
-                        console.print(f"[dim]{traceback.format_exc()}[/dim]")
+        # Immediately list tools while session is fresh
+        status.update(f"  [dim]Retrieving tools (attempt {attempt}/{max_attempts})...[/dim]")
+        list_start = time.monotonic()
+        async with asyncio.timeout(15.0):
+            tools = await mcp_session.session.list_tools()
+        vlog_timing("Tool listing", time.monotonic() - list_start)
+        vlog(f"Received [bold cyan]{len(tools)}[/bold cyan] tools")
+        vlog_timing("Total connect+list", time.monotonic() - total_start)
 
-                # Clean up partial connection
-                if client:
-                    try:
-                        await client.__aexit__(None, None, None)
-                    except Exception:
-                        pass
+        # Remember the list as the fallback for when the server can't be reached
+        await asyncio.to_thread(save_tools, server_url, tools)
+        return mcp_session, tools
 
-                if attempt < max_attempts:
-                    await asyncio.sleep(wait_seconds)
+    result = await _retry_connect(_attempt, max_attempts, wait_seconds, deadline)
+    if result is not None:
+        return result
 
-    return None, []
+    cached_tools = load_cached_tools(server_url)
+    if cached_tools:
+        console.print("  [yellow]Serving cached tool list[/yellow]")
+    return None, cached_tools
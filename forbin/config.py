@@ -1,12 +1,21 @@
-import json
 import os
 from pathlib import Path
 from typing import Optional
 
-from dotenv import load_dotenv
+from . import jsonfmt
 
-# Load environment variables from .env file
-load_dotenv()
+
+def _load_env_file():
+    """Load variables from a .env file, unless FORBIN_SKIP_DOTENV says the environment is complete."""
+    if os.getenv("FORBIN_SKIP_DOTENV"):
+        return
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+
+# Load environment variables from .env file (before the paths below read them)
+_load_env_file()
 
 # File Paths
 FORBIN_DIR = Path(os.getenv("FORBIN_DIR", str(Path.home() / ".forbin")))
@@ -24,25 +33,50 @@ def ensure_forbin_dir():
             console.print(f"[yellow]Warning: Could not create directory {FORBIN_DIR}: {e}[/yellow]")
 
 
+# Last parsed config file. Reused while the file's path, mtime and size are unchanged,
+# so repeated get_setting()/reload_config() calls don't re-read and re-parse it.
+_config_cache: dict = {"key": None, "data": None}
+
+
+def _config_file_key() -> Optional[tuple]:
+    try:
+        st = CONFIG_FILE.stat()
+    except OSError:
+        return None
+    return (str(CONFIG_FILE), st.st_mtime_ns, st.st_size)
+
+
 def load_config() -> dict:
     """Load configuration from JSON file."""
-    if CONFIG_FILE.exists():
-        try:
-            with open(CONFIG_FILE) as f:
-                return json.load(f)
-        except Exception as e:
-            from .display import console
+    key = _config_file_key()
+    if key is None:
+        return {}
+    if _config_cache["key"] == key:
+        return dict(_config_cache["data"])
 
-            console.print(f"[yellow]Warning: Could not load config file: {e}[/yellow]")
-    return {}
+    try:
+        with open(CONFIG_FILE, "rb") as f:
+            data = jsonfmt.loads(f.read())
+        if not isinstance(data, dict):
+            raise ValueError("expected a JSON object")
+    except Exception as e:
+        from .display import console
+
+        console.print(f"[yellow]Warning: Could not load config file: {e}[/yellow]")
+        return {}
+
+    _config_cache["key"], _config_cache["data"] = key, data
+    return dict(data)
 
 
 def save_config(config: dict) -> bool:
     """Save configuration to JSON file."""
     try:
         ensure_forbin_dir()
-        with open(CONFIG_FILE, "w") as f:
-            json.dump(config, f, indent=2)
+        with open(CONFIG_FILE, "w", encoding="utf-8") as f:
+            f.write(jsonfmt.dumps(config, pretty=True))
+        # Keep the cache warm with what was just written
+        _config_cache["key"], _config_cache["data"] = _config_file_key(), dict(config)
         return True
     except Exception as e:
         from .display import console
@@ -51,15 +85,21 @@ def save_config(config: dict) -> bool:
         return False
 
 
-def get_setting(key: str, default: str = "") -> str:
-    """Get setting with priority: Env Var > Config File > Default."""
+def get_setting(key: str, default: str = "", config: Optional[dict] = None) -> str:
+    """
+    Get setting with priority: Env Var > Config File > Default.
+
+    Pass config to resolve against an already-loaded config dict instead
+    of the file.
+    """
     # 1. Environment Variable
     env_val = os.getenv(key)
     if env_val:
         return env_val
 
     # 2. Config File
-    config = load_config()
+    if config is None:
+        config = load_config()
     if key in config:
         return str(config[key])
 
@@ -81,18 +121,42 @@ def validate_config() -> bool:
     return True
 
 
-def reload_config():
-    """Reload module-level config variables from settings."""
+_SETTING_KEYS = ("MCP_SERVER_URL", "MCP_TOKEN", "MCP_HEALTH_URL", "VERBOSE")
+_TRUTHY = frozenset({"true", "1", "yes", "on", "y", "t"})
+
+
+def _is_truthy(value: str) -> bool:
+    return bool(value) and value.strip().lower() in _TRUTHY
+
+
+def _resolve_settings(cfg: Optional[dict] = None) -> dict:
+    """Resolve every setting against one config dict, reading the file at most once."""
+    if cfg is None:
+        cfg = load_config()
+    return {key: get_setting(key, config=cfg) for key in _SETTING_KEYS}
+
+
+def reload_config(from_dict: Optional[dict] = None):
+    """
+    Reload module-level config variables from settings.
+
+    Args:
+        from_dict: Config dict that was just saved. When given, settings are
+            taken from it (environment variables still win) and the config
+            file is not read again.
+    """
     global MCP_SERVER_URL, MCP_TOKEN, MCP_HEALTH_URL, VERBOSE
-    MCP_SERVER_URL = get_setting("MCP_SERVER_URL")
-    MCP_TOKEN = get_setting("MCP_TOKEN")
-    MCP_HEALTH_URL = get_setting("MCP_HEALTH_URL") or None
-    VERBOSE = get_setting("VERBOSE").lower() in ("true", "1", "yes")
+    settings = _resolve_settings(from_dict)
+    MCP_SERVER_URL = settings["MCP_SERVER_URL"]
+    MCP_TOKEN = settings["MCP_TOKEN"]
+    MCP_HEALTH_URL = settings["MCP_HEALTH_URL"] or None
+    VERBOSE = _is_truthy(settings["VERBOSE"])
 
 
-def run_first_time_setup():
+async def run_first_time_setup():
     """Interactive first-time setup wizard."""
     from .display import console
+    from .utils import ainput
 
     console.print()
     console.print("[bold cyan]First-time setup[/bold cyan]")
@@ -104,7 +168,7 @@ def run_first_time_setup():
     console.print("[bold]MCP Server URL[/bold] [dim](required)[/dim]")
     console.print("  The URL of your MCP server endpoint (e.g. https://example.com/mcp)")
     while True:
-        server_url = input("  MCP Server URL: ").strip()
+        server_url = (await ainput("  MCP Server URL: ")).strip()
         if server_url:
             break
         console.print("  [red]This field is required.[/red]")
@@ -114,7 +178,7 @@ def run_first_time_setup():
     console.print("[bold]MCP Token[/bold] [dim](required)[/dim]")
     console.print("  Bearer token for authentication")
     while True:
-        token = input("  MCP Token: ").strip()
+        token = (await ainput("  MCP Token: ")).strip()
         if token:
             break
         console.print("  [red]This field is required.[/red]")
@@ -123,7 +187,7 @@ def run_first_time_setup():
     console.print()
     console.print("[bold]Health Check URL[/bold] [dim](optional)[/dim]")
     console.print("  For waking up suspended services (e.g. Fly.io)")
-    health_url = input("  Health URL (press Enter to skip): ").strip()
+    health_url = (await ainput("  Health URL (press Enter to skip): ")).strip()
 
     # Build config
     config = {
@@ -141,16 +205,18 @@ def run_first_time_setup():
             "[dim]You can change settings anytime with 'c' in the menu or 'forbin --config'[/dim]"
         )
         console.print()
-        reload_config()
+        reload_config(config)
     else:
         console.print("[red]Failed to save configuration.[/red]")
         console.print()
 
 
 # Initialize Configuration
-MCP_SERVER_URL: Optional[str] = get_setting("MCP_SERVER_URL") or None
-MCP_HEALTH_URL: Optional[str] = get_setting("MCP_HEALTH_URL") or None
-MCP_TOKEN: Optional[str] = get_setting("MCP_TOKEN") or None
+_settings = _resolve_settings()
+MCP_SERVER_URL: Optional[str] = _settings["MCP_SERVER_URL"] or None
+MCP_HEALTH_URL: Optional[str] = _settings["MCP_HEALTH_URL"] or None
+MCP_TOKEN: Optional[str] = _settings["MCP_TOKEN"] or None
 
 # Runtime flags
-VERBOSE: bool = get_setting("VERBOSE").lower() in ("true", "1", "yes")
+VERBOSE: bool = _is_truthy(_settings["VERBOSE"])
+del _settings
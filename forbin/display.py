@@ -1,20 +1,49 @@
-import json
-from typing import List, Any, Optional
+import re
+from functools import lru_cache
+from typing import List, Any, Optional, Tuple, TYPE_CHECKING
 from rich.console import Console, Group
 from rich.table import Table
 from rich.panel import Panel
+from rich.rule import Rule
 from rich.text import Text
-from rich.syntax import Syntax
 from rich.control import Control
 from rich.segment import ControlType
 
+from . import jsonfmt
+
+if TYPE_CHECKING:
+    from rich.syntax import Syntax, SyntaxTheme
+
+# ```json ... ``` or ``` ... ``` code blocks in tool descriptions
+_CODE_BLOCK_PATTERN = re.compile(r"```(\w*)\n(.*?)```", re.DOTALL)
+
 # Global console instance with constrained width for better readability
 console = Console(width=100)
 
 
-def display_logo():
-    """Display the Forbin ASCII logo."""
-    logo = """
+@lru_cache(maxsize=None)
+def _syntax_theme() -> "SyntaxTheme":
+    # Syntax() builds a new theme, with an empty style cache, for every theme
+    # name it is given; one shared instance keeps the styles resolved so far
+    from rich.syntax import Syntax
+
+    return Syntax.get_theme("monokai")
+
+
+def make_syntax(code: str, lexer: str = "json") -> "Syntax":
+    """
+    Build a monokai-themed Syntax renderable without line numbers.
+
+    rich.syntax pulls in Pygments, so it is imported on first use rather
+    than at startup; later calls find it in sys.modules.
+    """
+    from rich.syntax import Syntax
+
+    return Syntax(code, lexer, theme=_syntax_theme(), line_numbers=False)
+
+
+# Parsed from markup once at import
+_LOGO = Text.from_markup("""
 [bold cyan]
   ███████╗ ██████╗ ██████╗ ██████╗ ██╗███╗   ██╗
   ██╔════╝██╔═══██╗██╔══██╗██╔══██╗██║████╗  ██║
@@ -24,8 +53,15 @@ def display_logo():
   ╚═╝      ╚═════╝ ╚═╝  ╚═╝╚═════╝ ╚═╝╚═╝  ╚═══╝[/bold cyan]
 [dim]         MCP Remote Tool Tester v1.0.0[/dim]
 [italic dim]    "This is the voice of world control..."[/italic dim]
-"""
-    console.print(logo)
+""")
+
+
+def display_logo():
+    """Display the Forbin ASCII logo."""
+    console.print(_LOGO)
+
+
+_NOT_CONFIGURED = Text("Not configured", style="dim")
 
 
 def display_config_panel(server_url: Optional[str], health_url: Optional[str] = None):
@@ -35,24 +71,61 @@ def display_config_panel(server_url: Optional[str], health_url: Optional[str] =
     config_table.add_column(style="bold cyan", justify="right")
     config_table.add_column(style="white")
 
-    server_url_display = server_url or "[dim]Not configured[/dim]"
-    config_table.add_row("Server URL:", server_url_display)
-    if health_url:
-        config_table.add_row("Health URL:", health_url)
-    else:
-        config_table.add_row("Health URL:", "[dim]Not configured[/dim]")
+    config_table.add_row("Server URL:", server_url or _NOT_CONFIGURED)
+    config_table.add_row("Health URL:", health_url or _NOT_CONFIGURED)
 
-    console.print()
     console.print(
-        Panel(
-            config_table,
-            title="[bold]Configuration[/bold]",
-            title_align="left",
-            border_style="cyan",
-            padding=(1, 2),
+        Group(
+            Text(""),
+            Panel(
+                config_table,
+                title="[bold]Configuration[/bold]",
+                title_align="left",
+                border_style="cyan",
+                padding=(1, 2),
+            ),
+            Text(""),
         )
     )
-    console.print()
+
+
+def display_config_settings(
+    server_url: Optional[str],
+    token: Optional[str],
+    health_url: Optional[str],
+    verbose: bool,
+    config_file: Any,
+):
+    """Display the editable settings for the config screen in a single render."""
+    not_set = "[dim]Not set[/dim]"
+    token_display = token[:8] + "..." if token and len(token) > 8 else token or not_set
+
+    settings = Table.grid(padding=(0, 1))
+    settings.add_column(style="bold cyan", justify="right")
+    settings.add_column(min_width=16)
+    settings.add_column()
+    settings.add_row("  1.", "MCP_SERVER_URL:", server_url or not_set)
+    settings.add_row("  2.", "MCP_TOKEN:", token_display)
+    settings.add_row("  3.", "MCP_HEALTH_URL:", health_url or not_set)
+    settings.add_row("  4.", "VERBOSE:", "[green]ON[/green]" if verbose else "[red]OFF[/red]")
+
+    console.print(
+        Group(
+            Text(""),
+            Text("Configuration", style="bold underline"),
+            Text(""),
+            settings,
+            Text(""),
+            Text(f"  Config file: {config_file}", style="dim"),
+            Text(""),
+        )
+    )
+
+
+# (icon, color) per step status
+_STEP_STYLES = {"in_progress": (">", "yellow"), "success": ("+", "green"), "skip": ("-", "dim")}
+# Cursor up one line and clear it; Control segments are immutable, so one is shared
+_ERASE_PREVIOUS_LINE = Control((ControlType.CURSOR_UP, 1), (ControlType.ERASE_IN_LINE, 2))
 
 
 def display_step(
@@ -67,23 +140,22 @@ def display_step(
         status: One of 'in_progress', 'success', 'skip'
         update: If True, updates the previous line instead of creating a new one
     """
-    icons = {"in_progress": ">", "success": "+", "skip": "-"}
-
-    colors = {"in_progress": "yellow", "success": "green", "skip": "dim"}
-
-    icon = icons.get(status, "*")
-    color = colors.get(status, "white")
-
+    icon, color = _STEP_STYLES.get(status, ("*", "white"))
     step_text = f"[{color}]{icon} Step {step_num}/{total_steps}:[/{color}] [bold {color}]{title}[/bold {color}]"
 
     if update:
         # Move cursor up one line and clear it, then print the updated status
-        console.control(Control((ControlType.CURSOR_UP, 1), (ControlType.ERASE_IN_LINE, 2)))
+        console.control(_ERASE_PREVIOUS_LINE)
         console.print(step_text)
     else:
         console.print(step_text)
 
 
+_NO_DESCRIPTION = "No description"
+# Longer descriptions are cut to fit the compact tool list
+_DESCRIPTION_WIDTH = 60
+
+
 def display_tools(tools: List[Any]):
     """Display a compact list of available tools."""
     if not tools:
@@ -94,112 +166,129 @@ def display_tools(tools: List[Any]):
         )
         return
 
-    console.print()
-    console.print("[bold underline]Available Tools[/bold underline]")
-    console.print()
+    # Build the whole list as one Text so it renders and flushes in a single write
+    listing = Text("\n")
+    listing.append("Available Tools", style="bold underline")
+    listing.append("\n\n")
 
+    append = listing.append  # bound once; called five times per tool
     for i, tool in enumerate(tools, 1):
-        description = tool.description.strip() if tool.description else "No description"
+        description = tool.description.strip() if tool.description else _NO_DESCRIPTION
         # Truncate long descriptions for compact display
-        if len(description) > 60:
-            description = description[:57] + "..."
-        console.print(
-            f"  [bold cyan]{i:2}[/bold cyan]. [white]{tool.name}[/white] [dim]- {description}[/dim]"
-        )
+        if len(description) > _DESCRIPTION_WIDTH:
+            description = f"{description[: _DESCRIPTION_WIDTH - 3]}..."
+        append(f"  {i:2}", style="bold cyan")
+        append(". ")
+        append(tool.name, style="white")
+        append(f" - {description}", style="dim")
+        append("\n")
 
-    console.print()
+    console.print(listing)
 
 
-def _highlight_json_in_text(text: str):
-    """Highlight JSON content in text with syntax colors.
+def display_batch_results(results: List[Any]):
+    """Display the outcome of a batch of tool calls as one table.
 
-    Detects JSON objects/arrays and applies basic syntax highlighting.
-    Returns a Text object with styled content.
+    Args:
+        results: (tool, result or exception, elapsed seconds) tuples from run_batch()
     """
-    import re
-
-    # Simple check if text looks like it contains JSON
-    if not any(char in text for char in ["{", "[", '":']):
-        return text
-
-    # Try to detect and highlight JSON-like patterns
-    result = Text()
-
-    # Pattern to match JSON-like content (simple approach)
-    # This will highlight common JSON patterns with colors
-    current_pos = 0
-
-    # Find JSON strings (simple pattern for "key": "value")
-    string_pattern = r'"([^"\\]*(\\.[^"\\]*)*)"'
-
-    for match in re.finditer(string_pattern, text):
-        # Add text before match
-        if match.start() > current_pos:
-            result.append(text[current_pos : match.start()])
-
-        # Add the matched string with color
-        matched_text = match.group(0)
-
-        # Check if this looks like a key (followed by :)
-        next_char_pos = match.end()
-        if next_char_pos < len(text) and text[next_char_pos : next_char_pos + 1].strip().startswith(
-            ":"
-        ):
-            result.append(matched_text, style="bold cyan")  # JSON key
+    table = Table(title="Batch Results", title_justify="left", border_style="green")
+    table.add_column("#", style="bold cyan", justify="right")
+    table.add_column("Tool", style="white")
+    table.add_column("Status")
+    table.add_column("Time", justify="right", style="dim")
+    table.add_column("Response", overflow="ellipsis", no_wrap=True, max_width=50)
+
+    for i, (tool, outcome, elapsed) in enumerate(results, 1):
+        if isinstance(outcome, Exception):
+            status = Text("failed", style="bold red")
+            summary = f"{type(outcome).__name__}: {outcome}"
         else:
-            result.append(matched_text, style="green")  # JSON value
+            failed = getattr(outcome, "is_error", False) is True
+            status = Text("error" if failed else "ok", style="bold red" if failed else "bold green")
+            texts = [getattr(item, "text", None) for item in (outcome.content or [])]
+            summary = " ".join(t.strip() for t in texts if isinstance(t, str)) or "No content"
+        table.add_row(str(i), tool.name, status, f"{elapsed:.2f}s", Text(summary))
+
+    console.print(Group(Text(""), table, Text("")))
+
+
+# Static parts of the --help text, parsed from markup once at import
+_HELP_HEAD = Text.from_markup(
+    "\n[bold]Usage:[/bold]\n"
+    "  forbin            Run interactive session\n"
+    "  forbin --test     Test connectivity only\n"
+    "  forbin --config   Run configuration wizard\n"
+    "  forbin --help     Show this help message\n"
+    "\n[bold]Configuration:[/bold]\n"
+)
+_HELP_TAIL = Text.from_markup(
+    "  Settings can also be set via .env file or environment variables\n"
+    "  Priority: .env / environment > ~/.forbin/config.json\n"
+    "\n[bold]Interactive Shortcuts:[/bold]\n"
+    "  [bold cyan]'v'[/bold cyan]   - Toggle verbose logging at any time\n"
+    "  [bold cyan]'c'[/bold cyan]   - View/update configuration\n"
+    "  [bold cyan]ESC[/bold cyan]   - Cancel a running tool call"
+)
+
+
+def display_help(config_file: Any):
+    """Display command-line usage, configuration and shortcut help."""
+    console.print(_HELP_HEAD + Text(f"  Config file: {config_file}\n") + _HELP_TAIL)
 
-        current_pos = match.end()
 
-    # Add remaining text
-    if current_pos < len(text):
-        remaining = text[current_pos:]
-        # Highlight other JSON syntax
-        remaining = remaining.replace("{", "{\u200b")  # Add zero-width space for splitting
-        remaining = remaining.replace("}", "}\u200b")
-        remaining = remaining.replace("[", "[\u200b")
-        remaining = remaining.replace("]", "]\u200b")
-        remaining = remaining.replace(":", ":\u200b")
+def display_tool_header(tool: Any):
+    """Display a simple header for the tool view."""
+    console.print(Group(Text(""), Rule(f"[bold cyan]{tool.name}[/bold cyan]"), Text("")))
+
+
+# Menus are parsed from markup once at import instead of on every redraw
+_TOOL_MENU = Text.from_markup(
+    "[bold underline]Options:[/bold underline]\n"
+    "  [bold cyan]d[/bold cyan] - View details\n"
+    "  [bold cyan]r[/bold cyan] - Run tool\n"
+    "  [bold cyan]b[/bold cyan] - Back to tool list\n"
+    "  [bold cyan]q[/bold cyan] - Quit\n"
+)
+
+
+def _build_command_menu(verbose: bool) -> Text:
+    verbose_state = "[green]ON[/green]" if verbose else "[red]OFF[/red]"
+    return Text.from_markup(
+        "[bold underline]Commands:[/bold underline]\n"
+        "  [bold cyan]number[/bold cyan] - Select a tool\n"
+        "  [bold cyan]1,3[/bold cyan]    - Run several tools concurrently\n"
+        f"  [bold cyan]v[/bold cyan]      - Toggle verbose logging (current: {verbose_state})\n"
+        "  [bold cyan]c[/bold cyan]      - Configuration settings\n"
+        "  [bold cyan]q[/bold cyan]      - Quit\n"
+    )
 
-        for part in remaining.split("\u200b"):
-            if part in ["{", "}", "[", "]"]:
-                result.append(part, style="bold yellow")
-            elif part == ":":
-                result.append(part, style="dim")
-            else:
-                result.append(part)
 
-    return result if len(result) > 0 else text
+_COMMAND_MENUS = {True: _build_command_menu(True), False: _build_command_menu(False)}
 
 
-def display_tool_header(tool: Any):
-    """Display a simple header for the tool view."""
-    console.print()
-    console.rule(f"[bold cyan]{tool.name}[/bold cyan]")
-    console.print()
+def display_command_menu(verbose: bool):
+    """Display the tool list commands, showing the current verbose state."""
+    console.print(_COMMAND_MENUS[bool(verbose)])
 
 
 def display_tool_menu():
     """Display the tool view menu options."""
-    console.print("[bold underline]Options:[/bold underline]")
-    console.print("  [bold cyan]d[/bold cyan] - View details")
-    console.print("  [bold cyan]r[/bold cyan] - Run tool")
-    console.print("  [bold cyan]b[/bold cyan] - Back to tool list")
-    console.print("  [bold cyan]q[/bold cyan] - Quit")
-    console.print()
+    console.print(_TOOL_MENU)
 
 
-def _parse_description_with_code_blocks(description: str) -> List[Any]:
-    """Parse description and extract code blocks for syntax highlighting."""
-    import re
+@lru_cache(maxsize=256)
+def _parse_description_with_code_blocks(description: str) -> Tuple[Any, ...]:
+    """
+    Parse description and extract code blocks for syntax highlighting.
 
+    Memoized by description text, so revisiting a tool reuses the parsed
+    renderables; the result is a tuple so callers can't mutate the cache.
+    """
     content: List[Any] = []
 
-    # Pattern to match ```json ... ``` or ``` ... ``` code blocks
-    code_block_pattern = r"```(\w*)\n(.*?)```"
-
     last_end = 0
-    for match in re.finditer(code_block_pattern, description, re.DOTALL):
+    for match in _CODE_BLOCK_PATTERN.finditer(description):
         # Add text before the code block
         before_text = description[last_end : match.start()].strip()
         if before_text:
@@ -211,7 +300,7 @@ def _parse_description_with_code_blocks(description: str) -> List[Any]:
         code = match.group(2).strip()
 
         # Add syntax-highlighted code block
-        content.append(Syntax(code, lang, theme="monokai", line_numbers=False))
+        content.append(make_syntax(code, lang))
         content.append(Text(""))
 
         last_end = match.end()
@@ -221,7 +310,25 @@ def _parse_description_with_code_blocks(description: str) -> List[Any]:
     if remaining:
         content.append(Text(remaining))
 
-    return content
+    return tuple(content)
+
+
+# Schema renderables keyed by id() of the tool's input schema. The schema is
+# kept alongside so a recycled id can't return another schema's Syntax.
+_schema_syntax_cache: dict[int, tuple[Any, "Syntax"]] = {}
+_SCHEMA_SYNTAX_CACHE_SIZE = 128
+
+
+def _schema_syntax(schema: Any) -> "Syntax":
+    """Return the syntax-highlighted JSON renderable for a tool's input schema, cached."""
+    entry = _schema_syntax_cache.get(id(schema))
+    if entry is not None and entry[0] is schema:
+        return entry[1]
+    syntax = make_syntax(jsonfmt.dumps(schema, pretty=True))
+    if len(_schema_syntax_cache) >= _SCHEMA_SYNTAX_CACHE_SIZE:
+        _schema_syntax_cache.clear()
+    _schema_syntax_cache[id(schema)] = (schema, syntax)
+    return syntax
 
 
 def display_tool_schema(tool: Any):
@@ -237,24 +344,26 @@ def display_tool_schema(tool: Any):
             content.append(Text(""))
 
     # Input Schema as syntax-highlighted JSON
-    if tool.inputSchema:
+    input_schema = tool.inputSchema
+    if input_schema:
         content.append(Text("Input Schema:", style="bold underline"))
         content.append(Text(""))
-        json_str = json.dumps(tool.inputSchema, indent=2)
-        content.append(Syntax(json_str, "json", theme="monokai", line_numbers=False))
+        content.append(_schema_syntax(input_schema))
     else:
         content.append(Text("No input parameters required.", style="dim"))
 
     # Combine all content
     panel_content = Group(*content)
 
-    console.print()
     console.print(
-        Panel(
-            panel_content,
-            title=f"[bold]{tool.name}[/bold] - Details",
-            border_style="blue",
-            expand=False,
+        Group(
+            Text(""),
+            Panel(
+                panel_content,
+                title=f"[bold]{tool.name}[/bold] - Details",
+                border_style="blue",
+                expand=False,
+            ),
+            Text(""),
         )
     )
-    console.print()
@@ -0,0 +1,39 @@
+"""JSON encode/decode helpers that use orjson when it is installed.
+
+orjson is an optional extra (pip install "forbin-mcp[fast]"); without it
+the standard library json module is used, configured to write what orjson
+writes: non-ASCII characters as-is and no spaces in compact output.
+"""
+
+import json
+from typing import Any, Callable, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+
+def dumps(obj: Any, pretty: bool = False, default: Optional[Callable[[Any], Any]] = None) -> str:
+    """
+    Serialize obj to a JSON string, indented by two spaces if pretty.
+
+    default is called for objects JSON can't represent, as in json.dumps().
+    """
+    if orjson is not None:
+        try:
+            option = orjson.OPT_INDENT_2 if pretty else 0
+            return orjson.dumps(obj, default=default, option=option).decode()
+        except TypeError:
+            # e.g. non-string keys or integers beyond 64 bits; stdlib handles these
+            pass
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False, default=default)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False, default=default)
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Parse a JSON document from a string or bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
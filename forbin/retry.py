@@ -0,0 +1,22 @@
+import random
+
+
+def backoff_delay(attempt: int, base: float = 1.0, cap: float = 30.0, jitter: float = 0.5) -> float:
+    """
+    Return the wait before retrying after a failed attempt.
+
+    The delay doubles with each attempt (base, 2*base, 4*base, ...), is
+    spread by +/- jitter so concurrent clients don't retry in lockstep,
+    and never exceeds cap.
+
+    Args:
+        attempt: The attempt that just failed, starting at 1
+        base: Delay after the first failure, in seconds
+        cap: Upper bound on the delay, in seconds
+        jitter: Fractional spread applied to the delay (0.5 = +/-50%)
+
+    Returns:
+        Seconds to wait before the next attempt
+    """
+    delay = min(cap, base * 2 ** (attempt - 1))
+    return min(cap, delay * (1 + random.uniform(-jitter, jitter)))
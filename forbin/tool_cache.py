@@ -0,0 +1,58 @@
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, List
+
+from . import config, jsonfmt
+
+# Cached tool lists older than this are not served
+MAX_CACHE_AGE = 7 * 24 * 3600
+
+
+def _cache_file() -> Path:
+    return config.FORBIN_DIR / "tools_cache.json"
+
+
+def save_tools(server_url: str, tools: List[Any]):
+    """
+    Persist the server's tool list as the last known good copy.
+
+    Only the attributes the tool views read (name, description and
+    inputSchema) are kept. Failures are ignored: the cache is a fallback,
+    never a reason for a connection to fail.
+    """
+    try:
+        data = {
+            "server_url": server_url,
+            "saved_at": time.time(),
+            "tools": [
+                {"name": t.name, "description": t.description, "inputSchema": t.inputSchema}
+                for t in tools
+            ],
+        }
+        # Serialized before the file is opened, so a failure can't leave it half-written
+        text = jsonfmt.dumps(data, default=str)
+        config.ensure_forbin_dir()
+        with open(_cache_file(), "w", encoding="utf-8") as f:
+            f.write(text)
+    except Exception:
+        pass
+
+
+def load_cached_tools(server_url: str, max_age: float = MAX_CACHE_AGE) -> List[Any]:
+    """
+    Return the last known tool list for server_url, or [] if there is none.
+
+    The tools are lightweight stand-ins with name, description and
+    inputSchema attributes, so they render like the real thing.
+    """
+    try:
+        with open(_cache_file(), "rb") as f:
+            data = jsonfmt.loads(f.read())
+        if data.get("server_url") != server_url:
+            return []
+        if time.time() - data.get("saved_at", 0) > max_age:
+            return []
+        return [SimpleNamespace(**entry) for entry in data.get("tools", [])]
+    except Exception:
+        return []
@@ -1,13 +1,18 @@
 import asyncio
 import json
+import os
 import sys
 import time
-from typing import Any, Dict, List, TYPE_CHECKING
-from rich.prompt import Prompt
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, List, Optional, Tuple, TYPE_CHECKING
+from rich.console import Group
 from rich.panel import Panel
-from rich.syntax import Syntax
+from rich.rule import Rule
+from rich.text import Text
 
-from .display import console
+from . import jsonfmt
+from .display import console, display_batch_results, make_syntax
+from .utils import aprompt
 from .verbose import vlog_json, vlog_timing
 
 if TYPE_CHECKING:
@@ -25,47 +30,48 @@ async def list_tools(mcp_session: "MCPSession") -> List[Any]:
         List of tool objects
     """
     with console.status("  [dim]Retrieving tool manifest...[/dim]", spinner="dots"):
-        tools = await asyncio.wait_for(mcp_session.list_tools(), timeout=15.0)
+        async with asyncio.timeout(15.0):
+            tools = await mcp_session.list_tools()
 
     return tools
 
 
+_BOOLEAN_TRUE = frozenset({"true", "t", "yes", "y", "1"})
+
+# Parser per JSON schema type; "string" and unknown types keep the text as typed
+_PARSERS: Dict[str, Callable[[str], Any]] = {
+    "boolean": lambda s: s.lower() in _BOOLEAN_TRUE,
+    "integer": int,
+    "number": float,
+    "object": json.loads,
+    "array": json.loads,
+}
+
+
 def parse_parameter_value(value_str: str, param_type: str) -> Any:
-    """Parse a string input into the appropriate type."""
+    """
+    Parse a string input into the appropriate type.
+
+    ValueError (json.JSONDecodeError for objects and arrays) propagates to
+    the caller, which asks for the value again.
+    """
     if not value_str.strip():
         return None
+    # Union types such as ["string", "null"] are lists, which can't be dict keys
+    parser = _PARSERS.get(param_type, str) if isinstance(param_type, str) else str
+    return parser(value_str)
 
-    if param_type == "boolean":
-        return value_str.lower() in ("true", "t", "yes", "y", "1")
-    elif param_type == "integer":
-        try:
-            return int(value_str)
-        except ValueError:
-            # Re-raise to be caught by caller
-            raise
-    elif param_type == "number":
-        try:
-            return float(value_str)
-        except ValueError:
-            raise
-    elif param_type in ("object", "array"):
-        try:
-            return json.loads(value_str)
-        except json.JSONDecodeError:
-            raise
-    else:  # string
-        return value_str
 
-
-def get_tool_parameters(tool: Any) -> Dict[str, Any]:
+async def get_tool_parameters(tool: Any) -> Dict[str, Any]:
     """Interactively collect parameters for a tool."""
     params: dict[str, Any] = {}
 
-    if not tool.inputSchema or not isinstance(tool.inputSchema, dict):
+    input_schema = tool.inputSchema
+    if not input_schema or not isinstance(input_schema, dict):
         return params
 
-    properties = tool.inputSchema.get("properties", {})
-    required = tool.inputSchema.get("required", [])
+    properties = input_schema.get("properties", {})
+    required = set(input_schema.get("required", []))
 
     if not properties:
         return params
@@ -79,21 +85,20 @@ def get_tool_parameters(tool: Any) -> Dict[str, Any]:
         param_desc = param_info.get("description", "")
         is_required = param_name in required
 
-        # Show parameter info
+        # Show parameter info (and enum values if present) in one print
         req_str = "[red](required)[/red]" if is_required else "[green](optional)[/green]"
-        console.print(f"[bold cyan]{param_name}[/bold cyan] ({param_type}) {req_str}")
+        intro = [f"[bold cyan]{param_name}[/bold cyan] ({param_type}) {req_str}"]
         if param_desc:
-            console.print(f"  [dim]{param_desc}[/dim]")
-
-        # Show enum values if present
+            intro.append(f"  [dim]{param_desc}[/dim]")
         if "enum" in param_info:
-            console.print(f"  Allowed values: {', '.join(str(v) for v in param_info['enum'])}")
+            intro.append(f"  Allowed values: {', '.join(map(str, param_info['enum']))}")
+        console.print("\n".join(intro))
 
         # Get value
         while True:
             try:
                 # We use generic Prompt and handle manual validation to support complex types and skipping
-                value_str = Prompt.ask("  ->", default="", show_default=False)
+                value_str = await aprompt("  ->", default="", show_default=False)
 
                 if not value_str:
                     if is_required:
@@ -118,138 +123,257 @@ def get_tool_parameters(tool: Any) -> Dict[str, Any]:
     return params
 
 
-async def _wait_for_escape():
-    """Listen for ESC key press in the background. Returns when ESC is detected."""
+def _terminal_fd() -> Optional[int]:
+    """Return stdin's file descriptor if it is a terminal we can put in cbreak mode, else None."""
     try:
-        import termios
-        import tty
-        import select
+        import termios  # noqa: F401
+        import tty  # noqa: F401
     except ImportError:
-        # Not available on this platform; wait forever (tool call will finish first)
-        await asyncio.Event().wait()
-        return
-
+        return None
     try:
-        fd = sys.stdin.fileno()
-    except (AttributeError, OSError):
-        # stdin is redirected (e.g. in pytest); wait forever
-        await asyncio.Event().wait()
-        return
-    if not sys.stdin.isatty():
-        await asyncio.Event().wait()
-        return
+        return sys.stdin.fileno() if sys.stdin.isatty() else None
+    except (AttributeError, OSError, ValueError):
+        # stdin is redirected (e.g. in pytest)
+        return None
+
+
+@contextmanager
+def _escape_pressed():
+    """
+    Watch the terminal for ESC while the block runs.
+
+    Yields a future that completes when ESC is pressed. stdin is registered
+    with the event loop, so nothing runs until a key is actually pressed.
+    Without a terminal the future never completes.
+    """
+    loop = asyncio.get_running_loop()
+    pressed = loop.create_future()
+
+    fd = _terminal_fd()
+    old_settings = None
+    reader_added = False
+
+    def _on_readable():
+        try:
+            data = os.read(fd, 64)
+        except OSError:
+            data = b""
+        if not data:
+            # EOF or a hung-up terminal: nothing more will arrive, so stop watching
+            loop.remove_reader(fd)
+        elif b"\x1b" in data and not pressed.done():  # ESC key
+            pressed.set_result(None)
 
-    old_settings = termios.tcgetattr(fd)
     try:
-        tty.setcbreak(fd)
-        while True:
-            if select.select([sys.stdin], [], [], 0.1)[0]:
-                char = sys.stdin.read(1)
-                if char == "\x1b":  # ESC key
-                    return
-            await asyncio.sleep(0.1)
+        if fd is not None:
+            import termios
+            import tty
+
+            old_settings = termios.tcgetattr(fd)
+            tty.setcbreak(fd)
+            try:
+                loop.add_reader(fd, _on_readable)
+                reader_added = True
+            except NotImplementedError:
+                # This loop can't watch stdin; ESC just isn't available
+                pass
+        yield pressed
     finally:
-        termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+        if reader_added:
+            loop.remove_reader(fd)
+        if old_settings is not None:
+            try:
+                termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+            except termios.error:
+                # The terminal is already gone
+                pass
+        pressed.cancel()
+
+
+async def _cancelled_by_escape(task: "asyncio.Task[Any]", status: str) -> bool:
+    """
+    Show a spinner until task finishes or ESC is pressed.
+
+    Returns True if ESC came first, in which case the task has been cancelled.
+    """
+    with _escape_pressed() as esc, console.status(status, spinner="dots"):
+        await asyncio.wait({task, esc}, return_when=asyncio.FIRST_COMPLETED)
+
+    if task.done():
+        return False
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+    console.print("\n[bold yellow]Cancelled by user[/bold yellow]\n")
+    return True
+
+
+# Results with at least this much text are formatted and printed on a worker thread
+_OFFLOAD_JSON_SIZE = 64 * 1024
+
+
+# First and last characters of a JSON object or array
+_JSON_ENDS = frozenset({"{}", "[]"})
+
+
+def _response_panel(body: Any) -> Panel:
+    return Panel(body, border_style="green", title="[bold]Response[/bold]", title_align="left")
+
+
+def _result_blocks(content: List[Any]) -> List[Any]:
+    """Build the renderables for a tool result's content items."""
+    blocks: List[Any] = []
+    for item in content:
+        text = getattr(item, "text", None)
+        if not text:
+            blocks.append(str(item))
+            continue
+
+        # Try to detect if it looks like JSON for syntax highlighting
+        text_stripped = text.strip()
+        if text_stripped[:1] + text_stripped[-1:] in _JSON_ENDS:
+            try:
+                # Validate, then pretty-print unless the server already indented it
+                parsed = jsonfmt.loads(text_stripped)
+                if "\n " in text_stripped[:64]:
+                    formatted = text_stripped
+                else:
+                    formatted = jsonfmt.dumps(parsed, pretty=True)
+                blocks.append(_response_panel(make_syntax(formatted)))
+                continue
+            except json.JSONDecodeError:
+                pass
+
+        # For non-JSON text responses
+        blocks.append(_response_panel(text_stripped))
+    return blocks
+
+
+def _print_result(content: List[Any]):
+    """Print a tool result, from the completion banner to the closing rule, in one call."""
+    blocks = _result_blocks(content) if content else ["[dim]No content returned[/dim]"]
+    console.print(
+        Group(
+            Text.from_markup("\n[bold green]Tool execution completed![/bold green]\n"),
+            Rule("[bold green]RESULT[/bold green]"),
+            Text(""),
+            *blocks,
+            Text(""),
+            Rule(),
+            Text(""),
+        )
+    )
 
 
 async def call_tool(mcp_session: "MCPSession", tool: Any, params: Dict[str, Any]):
     """Call a tool with the given parameters."""
-    console.print()
-    console.rule("[bold magenta]CALLING TOOL[/bold magenta]")
-    console.print(f"Tool: [bold]{tool.name}[/bold]")
-    console.print()
+    console.print(
+        Group(
+            Text(""),
+            Rule("[bold magenta]CALLING TOOL[/bold magenta]"),
+            Text.from_markup(f"Tool: [bold]{tool.name}[/bold]"),
+            Text(""),
+        )
+    )
 
     # Verbose: show input schema
     if tool.inputSchema:
         vlog_json("Tool Input Schema", tool.inputSchema)
 
-    # Show parameters nicely
+    # Show parameters nicely, then the executing line, in one print
     if params:
-        json_str = json.dumps(params, indent=2)
-        console.print(
-            Panel(
-                Syntax(json_str, "json", theme="monokai", line_numbers=False),
-                title="[bold]Parameters[/bold]",
-                title_align="left",
-                border_style="cyan",
-            )
+        params_view: Any = Panel(
+            make_syntax(jsonfmt.dumps(params, pretty=True)),
+            title="[bold]Parameters[/bold]",
+            title_align="left",
+            border_style="cyan",
         )
     else:
-        console.print("[dim]No parameters[/dim]")
-
-    console.print("\n[bold]Executing...[/bold] [dim](press ESC to cancel)[/dim]")
+        params_view = "[dim]No parameters[/dim]"
+    console.print(
+        Group(
+            params_view,
+            Text.from_markup("\n[bold]Executing...[/bold] [dim](press ESC to cancel)[/dim]"),
+        )
+    )
 
     try:
         call_start = time.monotonic()
         tool_task = asyncio.create_task(mcp_session.call_tool(tool.name, params))
-        esc_task = asyncio.create_task(_wait_for_escape())
-
-        with console.status("Waiting for response...", spinner="dots"):
-            done, pending = await asyncio.wait(
-                {tool_task, esc_task},
-                return_when=asyncio.FIRST_COMPLETED,
-            )
-
-        for task in pending:
-            task.cancel()
-            try:
-                await task
-            except asyncio.CancelledError:
-                pass
-
-        if esc_task in done:
-            console.print("\n[bold yellow]Cancelled by user[/bold yellow]\n")
+        if await _cancelled_by_escape(tool_task, "Waiting for response..."):
             return
 
         result = tool_task.result()
         vlog_timing("Full round-trip", time.monotonic() - call_start)
 
-        console.print("\n[bold green]Tool execution completed![/bold green]\n")
-        console.rule("[bold green]RESULT[/bold green]")
-        console.print()
-
-        # Extract and display result
-        if result.content:
-            for item in result.content:
-                text = getattr(item, "text", None)
-                if text:
-                    # Try to detect if it looks like JSON for syntax highlighting
-                    text_stripped = text.strip()
-                    if text_stripped.startswith(("{", "[")) and text_stripped.endswith(("}", "]")):
-                        try:
-                            # Validate and pretty-print JSON
-                            parsed = json.loads(text_stripped)
-                            formatted = json.dumps(parsed, indent=2)
-                            console.print(
-                                Panel(
-                                    Syntax(formatted, "json", theme="monokai", line_numbers=False),
-                                    border_style="green",
-                                    title="[bold]Response[/bold]",
-                                    title_align="left",
-                                )
-                            )
-                            continue
-                        except json.JSONDecodeError:
-                            pass
-
-                    # For non-JSON text responses
-                    console.print(
-                        Panel(
-                            text.strip(),
-                            border_style="green",
-                            title="[bold]Response[/bold]",
-                            title_align="left",
-                        )
-                    )
-                else:
-                    console.print(str(item))
+        content = result.content or []
+        size = sum(
+            len(t) for t in (getattr(item, "text", None) for item in content) if isinstance(t, str)
+        )
+        if size < _OFFLOAD_JSON_SIZE:
+            _print_result(content)
         else:
-            console.print("[dim]No content returned[/dim]")
-
-        console.print()
-        console.rule()
-        console.print()
+            # Keep the loop serving the session while a big payload is parsed,
+            # re-indented and highlighted (Pygments lexes it as it prints)
+            await asyncio.to_thread(_print_result, content)
 
     except Exception as e:
         console.print(f"[bold red]Tool execution failed:[/bold red] {type(e).__name__}")
         console.print(f"   Error: {e}\n")
+
+
+async def run_batch(
+    mcp_session: "MCPSession",
+    tools: List[Any],
+    params_list: List[Dict[str, Any]],
+    concurrency: int = 8,
+) -> List[Tuple[Any, Any, float]]:
+    """
+    Call several tools concurrently, at most `concurrency` at a time.
+
+    Args:
+        mcp_session: Connected MCPSession
+        tools: Tools to call
+        params_list: Parameters for each tool, in the same order
+        concurrency: Maximum number of calls in flight
+
+    Returns:
+        One (tool, result or exception, elapsed seconds) tuple per tool, in input order
+    """
+    sem = asyncio.Semaphore(concurrency)
+
+    async def _one(tool: Any, params: Dict[str, Any]) -> Tuple[Any, Any, float]:
+        async with sem:
+            start = time.monotonic()
+            try:
+                outcome: Any = await mcp_session.call_tool(tool.name, params)
+            except Exception as e:
+                outcome = e
+            return tool, outcome, time.monotonic() - start
+
+    return list(await asyncio.gather(*(_one(t, p) for t, p in zip(tools, params_list))))
+
+
+async def call_tools_batch(mcp_session: "MCPSession", tools: List[Any]):
+    """Collect parameters for each tool, then run them all concurrently."""
+    params_list = []
+    for tool in tools:
+        console.print()
+        console.rule(f"[bold cyan]{tool.name}[/bold cyan]")
+        params_list.append(await get_tool_parameters(tool))
+
+    console.print()
+    console.rule("[bold magenta]CALLING TOOLS[/bold magenta]")
+    console.print(
+        f"\n[bold]Executing {len(tools)} tools...[/bold] [dim](press ESC to cancel)[/dim]"
+    )
+
+    batch_start = time.monotonic()
+    batch_task = asyncio.create_task(run_batch(mcp_session, tools, params_list))
+    if await _cancelled_by_escape(batch_task, "Waiting for responses..."):
+        return
+
+    vlog_timing("Batch round-trip", time.monotonic() - batch_start)
+    display_batch_results(batch_task.result())
@@ -1,8 +1,12 @@
 import sys
 import asyncio
 import logging
-import select
+import os
+import re
+import threading
+from rich.prompt import Prompt
 from . import config
+from .verbose import vlog
 
 
 # Suppress stderr warnings from MCP library (like "Session termination failed: 400")
@@ -24,6 +28,8 @@ class FilteredStderr:
             "handle_request_async",
             "_handle_post_request",
         ]
+        # One C-level search per line instead of a Python loop over the patterns
+        self._suppress_re = re.compile("|".join(map(re.escape, self.suppress_patterns)))
         self.buffer = ""
         self.suppressing = False
         self.suppress_depth = 0
@@ -31,11 +37,23 @@ class FilteredStderr:
     def write(self, text):
         # If verbose mode is ON, don't suppress anything
         if config.VERBOSE:
+            if self.buffer:
+                text, self.buffer = self.buffer + text, ""
             self.original_stderr.write(text)
             return
 
+        # Decide per complete line: writers often split a line across several
+        # writes, and a pattern split that way would otherwise slip through
+        self.buffer += text
+        if "\n" not in self.buffer:
+            return
+        *lines, self.buffer = self.buffer.split("\n")
+        for line in lines:
+            self._write_line(line + "\n")
+
+    def _write_line(self, text):
         # Check if this line starts a suppressible error block
-        if any(pattern in text for pattern in self.suppress_patterns):
+        if self._suppress_re.search(text):
             self.suppressing = True
             self.suppress_depth = 10  # Suppress next 10 lines
             return
@@ -60,6 +78,13 @@ class FilteredStderr:
             self.original_stderr.write(text)
 
     def flush(self):
+        # A partial line is judged on its own rather than held back indefinitely
+        if self.buffer:
+            line, self.buffer = self.buffer, ""
+            if config.VERBOSE:
+                self.original_stderr.write(line)
+            else:
+                self._write_line(line)
         self.original_stderr.flush()
 
 
@@ -74,8 +99,6 @@ class _VerboseLogHandler(logging.Handler):
         if not config.VERBOSE:
             return
         try:
-            from .verbose import vlog
-
             msg = self.format(record)
             # Truncate very long messages
             if len(msg) > 500:
@@ -123,7 +146,8 @@ def setup_logging():
 async def listen_for_toggle():
     """
     Background task to listen for 'v' key to toggle verbose logging.
-    Uses non-blocking stdin read.
+    Event-driven: stdin is registered with the event loop, so the task
+    sleeps until a key is actually pressed.
     """
     # Only try to import termios/tty on Unix-like systems
     try:
@@ -132,33 +156,93 @@ async def listen_for_toggle():
     except ImportError:
         return
 
-    fd = sys.stdin.fileno()
     # Check if we are in a terminal
     if not sys.stdin.isatty():
         return
+    fd = sys.stdin.fileno()
+    loop = asyncio.get_running_loop()
+
+    def _on_readable():
+        try:
+            data = os.read(fd, 64)
+        except OSError:
+            data = b""
+        if not data:
+            # EOF or a hung-up terminal: nothing more will arrive, so stop
+            # watching instead of waking on every loop iteration
+            loop.remove_reader(fd)
+            return
+        for _ in range(data.lower().count(b"v")):
+            config.VERBOSE = not config.VERBOSE
+            from .display import console
+
+            status = "[bold green]ON[/bold green]" if config.VERBOSE else "[bold red]OFF[/bold red]"
+            # Clear current line and print toggle status
+            console.print(f"\n[bold cyan]Verbose logging toggled {status}[/bold cyan]")
 
     old_settings = termios.tcgetattr(fd)
+    reader_added = False
     try:
         tty.setcbreak(fd)
-        while True:
-            # Non-blocking check for input
-            if select.select([sys.stdin], [], [], 0.1)[0]:
-                char = sys.stdin.read(1).lower()
-                if char == "v":
-                    config.VERBOSE = not config.VERBOSE
-                    from .display import console
-
-                    status = (
-                        "[bold green]ON[/bold green]"
-                        if config.VERBOSE
-                        else "[bold red]OFF[/bold red]"
-                    )
-                    # Clear current line and print toggle status
-                    console.print(f"\n[bold cyan]Verbose logging toggled {status}[/bold cyan]")
-
-            await asyncio.sleep(0.1)
-    except Exception:
+        loop.add_reader(fd, _on_readable)
+        reader_added = True
+        # Runs until cancelled
+        await loop.create_future()
+    except (OSError, NotImplementedError, termios.error):
         # Silently fail if something goes wrong with the terminal settings
         pass
     finally:
-        termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+        if reader_added:
+            loop.remove_reader(fd)
+        try:
+            termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+        except termios.error:
+            # The terminal is already gone
+            pass
+
+
+async def run_in_input_thread(func, *args, **kwargs):
+    """
+    Run a blocking stdin read in a daemon thread and await its result.
+
+    Keeps the event loop serving the MCP session while the user is typing.
+    A daemon thread is used instead of asyncio.to_thread() because the
+    default executor is joined at shutdown, which would hang Ctrl+C until
+    the pending read returned.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def _set_result(value):
+        if not future.done():
+            future.set_result(value)
+
+    def _set_exception(exc):
+        if not future.done():
+            future.set_exception(exc)
+
+    def _worker():
+        try:
+            result = func(*args, **kwargs)
+        except BaseException as e:
+            callback, value = _set_exception, e
+        else:
+            callback, value = _set_result, result
+        try:
+            loop.call_soon_threadsafe(callback, value)
+        except RuntimeError:
+            # Loop already closed (e.g. exiting after Ctrl+C)
+            pass
+
+    threading.Thread(target=_worker, daemon=True).start()
+    return await future
+
+
+async def ainput(prompt: str = "") -> str:
+    """Async equivalent of input()."""
+    return await run_in_input_thread(input, prompt)
+
+
+async def aprompt(*args, **kwargs) -> str:
+    """Async equivalent of rich's Prompt.ask()."""
+    return await run_in_input_thread(Prompt.ask, *args, **kwargs)
@@ -4,15 +4,13 @@ All functions are no-ops when config.VERBOSE is False,
 so callers don't need to check the flag themselves.
 """
 
-import json
 import time
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, contextmanager
 
-from . import config
-from .display import console
+from . import config, jsonfmt
+from .display import console, make_syntax
 
 from rich.panel import Panel
-from rich.syntax import Syntax
 
 
 def vlog(message: str):
@@ -30,10 +28,10 @@ def vlog_json(label: str, data):
         if isinstance(data, str):
             json_str = data
         else:
-            json_str = json.dumps(data, indent=2, default=str)
+            json_str = jsonfmt.dumps(data, pretty=True, default=str)
         console.print(
             Panel(
-                Syntax(json_str, "json", theme="monokai", line_numbers=False),
+                make_syntax(json_str),
                 title=f"[bold]{label}[/bold]",
                 title_align="left",
                 border_style="dim",
@@ -58,7 +56,22 @@ def vlog_timing(label: str, elapsed: float):
 @asynccontextmanager
 async def vtimer(label: str):
     """Async context manager that times an await block and vlogs the result."""
+    if not config.VERBOSE:
+        yield
+        return
     start = time.monotonic()
     yield
-    elapsed = time.monotonic() - start
-    vlog_timing(label, elapsed)
+    vlog_timing(label, time.monotonic() - start)
+
+
+@contextmanager
+def vtimed(label: str):
+    """Context manager that times a block (including early returns) and vlogs the result."""
+    if not config.VERBOSE:
+        yield
+        return
+    start = time.monotonic()
+    try:
+        yield
+    finally:
+        vlog_timing(label, time.monotonic() - start)
@@ -1,9 +1,31 @@
 """Pytest configuration and fixtures."""
 
+from io import StringIO
+
 import pytest
 from unittest.mock import Mock, AsyncMock
 
 
+@pytest.fixture(autouse=True)
+def reset_http_client():
+    """Drop the shared httpx client and remembered wake-ups so each test starts cold."""
+    import forbin.client
+
+    forbin.client._http_client = None
+    forbin.client._health_cache.clear()
+    yield
+    forbin.client._http_client = None
+    forbin.client._health_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def isolate_forbin_dir(tmp_path, monkeypatch):
+    """Keep files Forbin writes at runtime (e.g. the tool list cache) out of ~/.forbin."""
+    import forbin.config
+
+    monkeypatch.setattr(forbin.config, "FORBIN_DIR", tmp_path / ".forbin")
+
+
 @pytest.fixture
 def mock_tool():
     """Create a mock MCP tool."""
@@ -83,6 +105,15 @@ def mock_httpx_client():
     return client
 
 
+@pytest.fixture
+def filtered_stderr():
+    """Create a FilteredStderr over an in-memory stream; returns (filtered, stream)."""
+    import forbin.utils
+
+    stream = StringIO()
+    return forbin.utils.FilteredStderr(stream), stream
+
+
 @pytest.fixture
 def env_vars(monkeypatch):
     """Set up environment variables for testing."""
@@ -56,6 +56,152 @@ async def test_connectivity_without_health_url(mock_mcp_client):
         mock_mcp_client.list_tools.assert_called()
 
 
+@pytest.mark.asyncio
+async def test_connect_waits_for_readiness_probe(mock_mcp_client, mock_httpx_client):
+    """Test that the MCP connection starts only once the server reports ready."""
+    events = []
+
+    def health_response(status):
+        response = Mock()
+        response.status_code = 200
+        response.json = Mock(return_value={"status": status})
+        return response
+
+    # Wake-up succeeds, the first readiness probe says starting, the second ready
+    responses = iter([health_response("ok"), health_response("starting"), health_response("ok")])
+
+    async def health_get(*args, **kwargs):
+        events.append("health")
+        return next(responses)
+
+    async def connect(*args):
+        events.append("connect")
+        return mock_mcp_client
+
+    mock_httpx_client.get = AsyncMock(side_effect=health_get)
+    mock_mcp_client.__aenter__ = AsyncMock(side_effect=connect)
+
+    with (
+        patch("forbin.config.MCP_SERVER_URL", "http://test.local/mcp"),
+        patch("forbin.config.MCP_TOKEN", "test-token"),
+        patch("forbin.config.MCP_HEALTH_URL", "http://test.local/health"),
+        patch("httpx.AsyncClient", return_value=mock_httpx_client),
+        patch("forbin.client.Client", return_value=mock_mcp_client),
+        patch("asyncio.sleep", new_callable=AsyncMock),
+    ):
+        await forbin.cli.test_connectivity()
+
+    assert events == ["health", "health", "health", "connect"]
+    mock_mcp_client.list_tools.assert_called()
+
+
+@pytest.mark.asyncio
+async def test_connectivity_closes_its_session(mock_mcp_client, mock_httpx_client):
+    """Test that test_connectivity closes the session it opened."""
+    with (
+        patch("forbin.config.MCP_SERVER_URL", "http://test.local/mcp"),
+        patch("forbin.config.MCP_TOKEN", "test-token"),
+        patch("forbin.config.MCP_HEALTH_URL", None),
+        patch("httpx.AsyncClient", return_value=mock_httpx_client),
+        patch("forbin.client.Client", return_value=mock_mcp_client),
+    ):
+        await forbin.cli.test_connectivity()
+
+        mock_mcp_client.list_tools.assert_called()
+        mock_mcp_client.__aexit__.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_reconnect_overlaps_old_session_cleanup(mock_mcp_client):
+    """Test that the old session is torn down while the server is woken up."""
+    woke = asyncio.Event()
+    cleaned = asyncio.Event()
+
+    async def cleanup():
+        # Only finishes once the wake-up probe has run, so a sequential
+        # cleanup-then-wake would deadlock
+        await woke.wait()
+        cleaned.set()
+
+    old_session = Mock()
+    old_session.cleanup = AsyncMock(side_effect=cleanup)
+
+    ok_response = Mock()
+    ok_response.status_code = 200
+
+    async def health_get(*args, **kwargs):
+        woke.set()
+        return ok_response
+
+    http_client = AsyncMock()
+    http_client.get = AsyncMock(side_effect=health_get)
+
+    with (
+        patch("forbin.config.MCP_SERVER_URL", "http://test.local/mcp"),
+        patch("forbin.config.MCP_TOKEN", "test-token"),
+        patch("forbin.config.MCP_HEALTH_URL", "http://test.local/health"),
+        patch("httpx.AsyncClient", return_value=http_client),
+        patch("forbin.client.Client", return_value=mock_mcp_client),
+    ):
+        session, tools = await asyncio.wait_for(forbin.cli.reconnect(old_session), timeout=2)
+
+        assert session is not None
+        assert cleaned.is_set()
+
+
+@pytest.mark.asyncio
+async def test_connectivity_wake_up_stops_at_budget(mock_mcp_client, mock_httpx_client, capsys):
+    """Test that the CLI gives up waking a server that never answers once the budget is used."""
+
+    async def hang(*args, **kwargs):
+        await asyncio.Event().wait()
+
+    mock_httpx_client.get = AsyncMock(side_effect=hang)
+
+    with (
+        patch("forbin.config.MCP_SERVER_URL", "http://test.local/mcp"),
+        patch("forbin.config.MCP_TOKEN", "test-token"),
+        patch("forbin.config.MCP_HEALTH_URL", "http://test.local/health"),
+        patch("httpx.AsyncClient", return_value=mock_httpx_client),
+        patch("forbin.client.Client", return_value=mock_mcp_client) as client_cls,
+        # Budget: 6 attempts x (0.05s backoff + 0.05s request) = 0.6s
+        patch("forbin.cli._RETRY_WAIT", 0.05),
+        patch("forbin.cli._REQUEST_TIMEOUT", 0.05),
+    ):
+        await asyncio.wait_for(forbin.cli.test_connectivity(), timeout=5)
+
+    output = capsys.readouterr().out
+    assert "wake-up time budget used" in output
+    assert "Failed to wake up server" in output
+    client_cls.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_connectivity_connect_stops_at_budget(mock_mcp_client, mock_httpx_client, capsys):
+    """Test that the CLI starts no new connection attempt once the budget is used."""
+
+    async def slow_failure(*args):
+        await asyncio.sleep(0.4)
+        raise ConnectionError("Connection refused")
+
+    mock_mcp_client.__aenter__ = AsyncMock(side_effect=slow_failure)
+
+    with (
+        patch("forbin.config.MCP_SERVER_URL", "http://test.local/mcp"),
+        patch("forbin.config.MCP_TOKEN", "test-token"),
+        patch("forbin.config.MCP_HEALTH_URL", None),
+        patch("httpx.AsyncClient", return_value=mock_httpx_client),
+        patch("forbin.client.Client", return_value=mock_mcp_client) as client_cls,
+        # Budget: 3 attempts x (0.05s backoff + 0.05s request) = 0.3s
+        patch("forbin.cli._RETRY_WAIT", 0.05),
+        patch("forbin.cli._REQUEST_TIMEOUT", 0.05),
+    ):
+        await asyncio.wait_for(forbin.cli.test_connectivity(), timeout=5)
+
+    assert "connection time budget used" in capsys.readouterr().out
+    assert client_cls.call_count == 1
+
+
 @pytest.mark.asyncio
 async def test_wake_up_then_connect_flow(mock_mcp_client, mock_httpx_client):
     """Test the wake-up -> wait -> connect flow."""
@@ -107,13 +253,9 @@ async def test_tool_discovery_and_call_flow(mock_mcp_client):
         mock_mcp_client.call_tool.assert_called_once()
 
 
-@pytest.mark.asyncio
-async def test_parameter_input_and_parsing_flow(mock_tool):
-    """Test the complete parameter input and parsing flow."""
-    # import forbin
-
-    # Test with various parameter types
-    test_cases = [
+@pytest.mark.parametrize(
+    "input_value, param_type, expected",
+    [
         ("hello world", "string", "hello world"),
         ("42", "integer", 42),
         ("3.14", "number", 3.14),
@@ -121,11 +263,11 @@ async def test_parameter_input_and_parsing_flow(mock_tool):
         ("false", "boolean", False),
         ('{"key": "value"}', "object", {"key": "value"}),
         ("[1, 2, 3]", "array", [1, 2, 3]),
-    ]
-
-    for input_value, param_type, expected in test_cases:
-        result = forbin.tools.parse_parameter_value(input_value, param_type)
-        assert result == expected, f"Failed for {param_type}: {input_value}"
+    ],
+)
+def test_parameter_input_and_parsing_flow(input_value, param_type, expected):
+    """Test the complete parameter input and parsing flow."""
+    assert forbin.tools.parse_parameter_value(input_value, param_type) == expected
 
 
 @pytest.mark.asyncio
@@ -2,8 +2,10 @@
 
 import pytest
 import asyncio
+import json
+import threading
+import httpx
 from unittest.mock import Mock, AsyncMock, patch
-from io import StringIO
 
 # Import the module to test
 # Import the modules to test
@@ -13,6 +15,11 @@ import forbin.client
 import forbin.utils
 import forbin.cli
 import forbin.config
+import forbin.async_loop
+import forbin.jsonfmt
+import forbin.retry
+import forbin.tool_cache
+import forbin.verbose
 
 
 class TestParameterParsing:
@@ -35,17 +42,15 @@ class TestParameterParsing:
         assert result == 3.14
         assert isinstance(result, float)
 
-    def test_parse_boolean_true(self):
+    @pytest.mark.parametrize("value", ["true", "True", "t", "yes", "y", "1"])
+    def test_parse_boolean_true(self, value):
         """Test parsing boolean true values."""
-        for value in ["true", "True", "t", "yes", "y", "1"]:
-            result = forbin.tools.parse_parameter_value(value, "boolean")
-            assert result is True
+        assert forbin.tools.parse_parameter_value(value, "boolean") is True
 
-    def test_parse_boolean_false(self):
+    @pytest.mark.parametrize("value", ["false", "False", "f", "no", "n", "0"])
+    def test_parse_boolean_false(self, value):
         """Test parsing boolean false values."""
-        for value in ["false", "False", "f", "no", "n", "0"]:
-            result = forbin.tools.parse_parameter_value(value, "boolean")
-            assert result is False
+        assert forbin.tools.parse_parameter_value(value, "boolean") is False
 
     def test_parse_object(self):
         """Test parsing JSON object."""
@@ -59,6 +64,11 @@ class TestParameterParsing:
         result = forbin.tools.parse_parameter_value(json_str, "array")
         assert result == [1, 2, 3, "four"]
 
+    def test_parse_union_type_kept_as_text(self):
+        """Test that a list-valued (union) type leaves the input as typed."""
+        result = forbin.tools.parse_parameter_value("42", ["string", "null"])
+        assert result == "42"
+
     def test_parse_empty_string(self):
         """Test parsing empty string."""
         result = forbin.tools.parse_parameter_value("", "string")
@@ -70,6 +80,51 @@ class TestParameterParsing:
         assert result is None
 
 
+class TestJsonFormatting:
+    """Test the orjson-with-stdlib-fallback JSON helpers."""
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_round_trip(self, use_orjson):
+        """Test that both backends produce the same two-space indented JSON."""
+        if use_orjson and forbin.jsonfmt.orjson is None:
+            pytest.skip("orjson not installed")
+        data = {"name": "test_tool", "properties": {"count": {"type": "integer"}}, "ok": True}
+        backend = forbin.jsonfmt.orjson if use_orjson else None
+
+        with patch("forbin.jsonfmt.orjson", backend):
+            text = forbin.jsonfmt.dumps(data, pretty=True)
+
+            assert text == json.dumps(data, indent=2)
+            assert forbin.jsonfmt.loads(text) == data
+            assert forbin.jsonfmt.loads(text.encode()) == data
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_default_serializes_unknown_types(self, use_orjson):
+        """Test that default= handles values JSON can't represent, on both backends."""
+        if use_orjson and forbin.jsonfmt.orjson is None:
+            pytest.skip("orjson not installed")
+        backend = forbin.jsonfmt.orjson if use_orjson else None
+
+        with patch("forbin.jsonfmt.orjson", backend):
+            text = forbin.jsonfmt.dumps({"ids": {2, 1}}, pretty=True, default=sorted)
+
+            assert text == json.dumps({"ids": [1, 2]}, indent=2)
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_backends_agree_on_compact_and_unicode(self, use_orjson):
+        """Test that both backends write compact JSON and non-ASCII text alike."""
+        if use_orjson and forbin.jsonfmt.orjson is None:
+            pytest.skip("orjson not installed")
+        backend = forbin.jsonfmt.orjson if use_orjson else None
+        data = {"name": "café", "ids": [1, 2]}
+
+        with patch("forbin.jsonfmt.orjson", backend):
+            assert forbin.jsonfmt.dumps(data) == '{"name":"café","ids":[1,2]}'
+            assert forbin.jsonfmt.dumps(data, pretty=True) == (
+                '{\n  "name": "café",\n  "ids": [\n    1,\n    2\n  ]\n}'
+            )
+
+
 class TestDisplayFunctions:
     """Test display and formatting functions."""
 
@@ -87,6 +142,25 @@ class TestDisplayFunctions:
         captured = capsys.readouterr()
         assert "No tools available" in captured.out
 
+    def test_display_command_menu_shows_verbose_state(self, capsys):
+        """Test that the command menu reflects the verbose setting."""
+        forbin.display.display_command_menu(True)
+        assert "(current: ON)" in capsys.readouterr().out
+
+        forbin.display.display_command_menu(False)
+        assert "(current: OFF)" in capsys.readouterr().out
+
+    def test_display_config_settings_masks_token(self, capsys):
+        """Test that the config screen shows settings and truncates the token."""
+        forbin.display.display_config_settings(
+            "http://test.local/mcp", "secret-token-value", None, False, "/tmp/config.json"
+        )
+        captured = capsys.readouterr()
+        assert "http://test.local/mcp" in captured.out
+        assert "secret-t..." in captured.out
+        assert "secret-token-value" not in captured.out
+        assert "Not set" in captured.out
+
     def test_display_tool_schema_with_params(self, mock_tool, capsys):
         """Test displaying tool schema with parameters."""
         forbin.display.display_tool_schema(mock_tool)
@@ -104,6 +178,20 @@ class TestDisplayFunctions:
         assert "simple_tool" in captured.out
         assert "No input parameters required" in captured.out
 
+    def test_display_tool_schema_reuses_syntax(self, mock_tool, capsys):
+        """Test that repeat views of a tool reuse the highlighted schema."""
+        schema = mock_tool.inputSchema
+        first = forbin.display._schema_syntax(schema)
+        forbin.display.display_tool_schema(mock_tool)
+        assert forbin.display._schema_syntax(schema) is first
+        assert "param1" in capsys.readouterr().out
+
+    def test_make_syntax_shares_theme(self):
+        """Test that highlighted blocks share one theme instance."""
+        first = forbin.display.make_syntax('{"a": 1}')
+        second = forbin.display.make_syntax("print(1)", "python")
+        assert first._theme is second._theme
+
 
 class TestWakeUpServer:
     """Test server wake-up functionality."""
@@ -160,6 +248,267 @@ class TestWakeUpServer:
             assert result is False
             assert mock_client.get.call_count == 2
 
+    @pytest.mark.asyncio
+    async def test_wake_up_staggers_over_hung_attempt(self):
+        """Test that a later attempt can win while an earlier one is still hanging."""
+        hung = asyncio.Event()
+        ok_response = Mock()
+        ok_response.status_code = 200
+
+        async def get(*args, **kwargs):
+            if mock_client.get.call_count == 1:
+                try:
+                    await asyncio.Event().wait()
+                finally:
+                    hung.set()
+            return ok_response
+
+        mock_client = AsyncMock()
+        mock_client.get = AsyncMock(side_effect=get)
+
+        result = await asyncio.wait_for(
+            forbin.client.wake_up_server(
+                "http://test.local/health", max_attempts=3, wait_seconds=0.05, client=mock_client
+            ),
+            timeout=2,
+        )
+
+        assert result is True
+        assert mock_client.get.call_count == 2
+        # The hung attempt was cancelled, not leaked
+        assert hung.is_set()
+
+    @pytest.mark.asyncio
+    async def test_wake_up_caps_outstanding_probes(self):
+        """Test that no more than max_in_flight probes hang on a cold server at once."""
+
+        async def get(*args, **kwargs):
+            await asyncio.Event().wait()
+
+        mock_client = AsyncMock()
+        mock_client.get = AsyncMock(side_effect=get)
+
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(
+                forbin.client.wake_up_server(
+                    "http://test.local/health",
+                    max_attempts=5,
+                    wait_seconds=0.01,
+                    client=mock_client,
+                    max_in_flight=2,
+                ),
+                timeout=0.3,
+            )
+
+        assert mock_client.get.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_wake_up_stops_at_deadline(self):
+        """Test that hung probes are abandoned once the caller's time budget is spent."""
+        import time
+
+        async def get(*args, **kwargs):
+            await asyncio.Event().wait()
+
+        mock_client = AsyncMock()
+        mock_client.get = AsyncMock(side_effect=get)
+
+        result = await asyncio.wait_for(
+            forbin.client.wake_up_server(
+                "http://test.local/health",
+                max_attempts=6,
+                wait_seconds=5,
+                client=mock_client,
+                deadline=time.monotonic() + 0.1,
+            ),
+            timeout=2,
+        )
+
+        assert result is False
+        assert mock_client.get.call_count == 1
+        assert mock_client.get.call_args.kwargs["timeout"] <= 0.1
+
+    @pytest.mark.asyncio
+    async def test_wake_up_reuses_shared_client(self, mock_httpx_client):
+        """Test that repeated wake-ups and readiness polls share one httpx client."""
+        with (
+            patch("httpx.AsyncClient", return_value=mock_httpx_client) as client_cls,
+            patch("forbin.client._HEALTH_TTL", 0.0),
+        ):
+            await forbin.client.wake_up_server("http://test.local/health", max_attempts=1)
+            await forbin.client.wait_until_ready("http://test.local/health", max_wait=1)
+            await forbin.client.wake_up_server("http://test.local/health", max_attempts=1)
+
+            assert client_cls.call_count == 1
+            assert mock_httpx_client.get.call_count == 3
+
+            await forbin.client.close_http_client()
+            mock_httpx_client.aclose.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_recent_wake_up_skips_probes(self, mock_httpx_client):
+        """Test that a wake-up within the TTL of a successful one doesn't probe again."""
+        with (
+            patch("httpx.AsyncClient", return_value=mock_httpx_client),
+            patch("forbin.client._HEALTH_TTL", 10.0),
+        ):
+            assert await forbin.client.wake_up_server("http://test.local/health", max_attempts=1)
+            assert await forbin.client.wake_up_server("http://test.local/health", max_attempts=1)
+            assert mock_httpx_client.get.call_count == 1
+
+            # A different server is still probed
+            await forbin.client.wake_up_server("http://other.local/health", max_attempts=1)
+            assert mock_httpx_client.get.call_count == 2
+
+
+class TestBackoffDelay:
+    """Test the retry backoff schedule."""
+
+    def test_delay_doubles_within_jitter(self):
+        """Test that delays grow exponentially and stay inside the jitter band."""
+        for attempt, expected in [(1, 1.0), (2, 2.0), (3, 4.0)]:
+            for _ in range(20):
+                delay = forbin.retry.backoff_delay(attempt, base=1.0, cap=30.0, jitter=0.5)
+                assert expected * 0.5 <= delay <= expected * 1.5
+
+    def test_delay_never_exceeds_cap(self):
+        """Test that late attempts are clamped to the cap, jitter included."""
+        for _ in range(20):
+            assert forbin.retry.backoff_delay(10, base=1.0, cap=5.0) <= 5.0
+
+    @pytest.mark.asyncio
+    async def test_connect_retries_back_off(self):
+        """Test that the connection loop sleeps a growing backoff and not after the last try."""
+        with (
+            patch("forbin.config.MCP_SERVER_URL", "http://test.local/mcp"),
+            patch("forbin.config.MCP_TOKEN", "test-token"),
+            patch("forbin.client.Client", side_effect=Exception("Connection refused")),
+            patch("forbin.retry.random.uniform", return_value=0.0),
+            patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+        ):
+            result = await forbin.client.connect_to_mcp_server(max_attempts=4, wait_seconds=3)
+
+            assert result is None
+            assert [call.args[0] for call in mock_sleep.call_args_list] == [1.0, 2.0, 3.0]
+
+
+class TestWaitUntilReady:
+    """Test post-wake readiness polling."""
+
+    @pytest.mark.asyncio
+    async def test_ready_immediately(self, mock_httpx_client):
+        """Test that a ready server returns on the first probe."""
+        with (
+            patch("httpx.AsyncClient", return_value=mock_httpx_client),
+            patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+        ):
+            result = await forbin.client.wait_until_ready("http://test.local/health", max_wait=5)
+
+            assert result is True
+            assert mock_httpx_client.get.call_count == 1
+            mock_sleep.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_ready_after_server_errors(self):
+        """Test that 5xx responses are retried until the server is ready."""
+        mock_client = AsyncMock()
+        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+        mock_client.__aexit__ = AsyncMock(return_value=None)
+
+        mock_response_fail = Mock()
+        mock_response_fail.status_code = 503
+        mock_response_success = Mock()
+        mock_response_success.status_code = 200
+        mock_client.get = AsyncMock(
+            side_effect=[mock_response_fail, mock_response_fail, mock_response_success]
+        )
+
+        with (
+            patch("httpx.AsyncClient", return_value=mock_client),
+            patch("asyncio.sleep", new_callable=AsyncMock),
+        ):
+            result = await forbin.client.wait_until_ready("http://test.local/health", max_wait=5)
+
+            assert result is True
+            assert mock_client.get.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_not_ready_within_budget(self):
+        """Test that polling gives up once max_wait is spent."""
+        mock_client = AsyncMock()
+        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+        mock_client.__aexit__ = AsyncMock(return_value=None)
+
+        import httpx
+
+        mock_client.get = AsyncMock(side_effect=httpx.ConnectError("Connection refused"))
+
+        with patch("httpx.AsyncClient", return_value=mock_client):
+            result = await forbin.client.wait_until_ready(
+                "http://test.local/health", max_wait=0.2, initial=0.05
+            )
+
+            assert result is False
+            assert mock_client.get.call_count >= 2
+
+    @pytest.mark.asyncio
+    async def test_backoff_is_jittered_and_capped(self):
+        """Test that delays stay within the jittered, 1s-capped backoff window."""
+        import httpx
+
+        mock_client = AsyncMock()
+        mock_client.get = AsyncMock(side_effect=httpx.RemoteProtocolError("Server disconnected"))
+
+        with (
+            patch("httpx.AsyncClient", return_value=mock_client),
+            patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+            patch("time.monotonic", side_effect=[float(i) for i in range(8)]),
+        ):
+            result = await forbin.client.wait_until_ready(
+                "http://test.local/health", max_wait=5, initial=0.5
+            )
+
+            assert result is False
+            delays = [call.args[0] for call in mock_sleep.call_args_list]
+            bases = [0.5, 0.75, 1.0, 1.0]
+            assert len(delays) == len(bases)
+            for delay, base in zip(delays, bases):
+                assert base * 0.5 <= delay <= base
+
+
+class TestReadinessBody:
+    """Test health-body readiness detection."""
+
+    @pytest.mark.asyncio
+    async def test_waits_while_body_reports_starting(self):
+        """Test that a 200 with a not-ready status keeps polling."""
+        starting = Mock(status_code=200)
+        starting.json = Mock(return_value={"status": "starting"})
+        ready = Mock(status_code=200)
+        ready.json = Mock(return_value={"status": "ok"})
+
+        mock_client = AsyncMock()
+        mock_client.get = AsyncMock(side_effect=[starting, ready])
+
+        with (
+            patch("httpx.AsyncClient", return_value=mock_client),
+            patch("asyncio.sleep", new_callable=AsyncMock),
+        ):
+            assert await forbin.client.wait_until_ready("http://test.local/health") is True
+            assert mock_client.get.call_count == 2
+
+    def test_non_json_body_counts_as_ready(self):
+        """Test that a plain-text health body is treated as ready."""
+        response = Mock(status_code=200)
+        response.json = Mock(side_effect=ValueError("not json"))
+        assert forbin.client._reports_ready(response) is True
+
+    def test_ready_false_counts_as_not_ready(self):
+        """Test that an explicit "ready": false is honoured."""
+        response = Mock(status_code=200)
+        response.json = Mock(return_value={"ready": False})
+        assert forbin.client._reports_ready(response) is False
+
 
 class TestConnectToMCPServer:
     """Test MCP server connection."""
@@ -198,6 +547,26 @@ class TestConnectToMCPServer:
 
             assert client is not None
 
+    @pytest.mark.asyncio
+    async def test_connect_builds_auth_once(self):
+        """Test that retries reuse one BearerAuth instead of rebuilding it."""
+        mock_client = AsyncMock()
+        mock_client.__aenter__ = AsyncMock(side_effect=Exception("Connection failed"))
+        mock_client.__aexit__ = AsyncMock(return_value=None)
+
+        with (
+            patch("forbin.config.MCP_TOKEN", "test-token"),
+            patch("forbin.client.Client", return_value=mock_client) as client_cls,
+            patch("forbin.client.BearerAuth") as auth_cls,
+            patch("asyncio.sleep", new_callable=AsyncMock),
+        ):
+            result = await forbin.client.connect_to_mcp_server(max_attempts=3, wait_seconds=0.1)
+
+            assert result is None
+            auth_cls.assert_called_once_with(token="test-token")
+            assert client_cls.call_count == 3
+            assert all(c.kwargs["auth"] is auth_cls.return_value for c in client_cls.call_args_list)
+
     @pytest.mark.asyncio
     async def test_connect_timeout(self):
         """Test connection timeout."""
@@ -213,6 +582,123 @@ class TestConnectToMCPServer:
 
             assert client is None
 
+    @pytest.mark.asyncio
+    async def test_connect_stops_at_deadline(self):
+        """Test that no new attempt starts once the deadline has passed."""
+        import time
+
+        mock_client = AsyncMock()
+        mock_client.__aenter__ = AsyncMock(side_effect=Exception("Connection refused"))
+
+        with (
+            patch("forbin.config.MCP_SERVER_URL", "http://test.local/mcp"),
+            patch("forbin.config.MCP_TOKEN", "test-token"),
+            patch("forbin.client.Client", return_value=mock_client) as client_cls,
+            patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+        ):
+            result = await forbin.client.connect_to_mcp_server(
+                max_attempts=3, wait_seconds=5, deadline=time.monotonic() - 1
+            )
+
+            assert result is None
+            assert client_cls.call_count == 1
+            mock_sleep.assert_called_once_with(0.0)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("grouped", [False, True])
+    async def test_connect_stops_on_rejected_token(self, grouped, capsys):
+        """Test that a 401, even inside an exception group, is not retried."""
+        request = httpx.Request("POST", "http://test.local/mcp")
+        error = httpx.HTTPStatusError(
+            "Unauthorized", request=request, response=httpx.Response(401, request=request)
+        )
+        mock_client = AsyncMock()
+        mock_client.__aenter__ = AsyncMock(
+            side_effect=ExceptionGroup("task group", [error]) if grouped else error
+        )
+
+        with (
+            patch("forbin.config.MCP_SERVER_URL", "http://test.local/mcp"),
+            patch("forbin.config.MCP_TOKEN", "bad-token"),
+            patch("forbin.client.Client", return_value=mock_client) as client_cls,
+            patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+        ):
+            result = await forbin.client.connect_to_mcp_server(max_attempts=3)
+
+            assert result is None
+            assert client_cls.call_count == 1
+            mock_sleep.assert_not_called()
+            assert "check MCP_TOKEN" in capsys.readouterr().out
+
+
+class TestToolCache:
+    """Test the last-known-good tool list cache."""
+
+    def test_round_trip(self, mock_tool_list):
+        """Test that saved tools come back with the attributes the views read."""
+        forbin.tool_cache.save_tools("http://test.local/mcp", mock_tool_list)
+
+        cached = forbin.tool_cache.load_cached_tools("http://test.local/mcp")
+
+        assert [t.name for t in cached] == ["test_tool", "simple_tool"]
+        assert cached[0].inputSchema == mock_tool_list[0].inputSchema
+        assert cached[1].inputSchema is None
+
+    def test_ignores_other_server_and_stale_cache(self, mock_tool_list):
+        """Test that a cache for a different URL, or an expired one, is not served."""
+        forbin.tool_cache.save_tools("http://test.local/mcp", mock_tool_list)
+
+        assert forbin.tool_cache.load_cached_tools("http://other.local/mcp") == []
+        assert forbin.tool_cache.load_cached_tools("http://test.local/mcp", max_age=-1) == []
+
+    def test_save_failure_is_ignored(self, mock_tool_list):
+        """Test that a tool that can't be saved leaves the previous cache in place."""
+        forbin.tool_cache.save_tools("http://test.local/mcp", mock_tool_list)
+
+        # A tool missing the attributes the cache stores
+        forbin.tool_cache.save_tools("http://test.local/mcp", [object()])
+
+        cached = forbin.tool_cache.load_cached_tools("http://test.local/mcp")
+        assert [t.name for t in cached] == ["test_tool", "simple_tool"]
+
+    @pytest.mark.asyncio
+    async def test_connect_failure_serves_cached_tools(self, mock_tool_list):
+        """Test that connect_and_list_tools falls back to the cached list."""
+        forbin.tool_cache.save_tools("http://test.local/mcp", mock_tool_list)
+        mock_client = AsyncMock()
+        mock_client.__aenter__ = AsyncMock(side_effect=Exception("Connection refused"))
+
+        with (
+            patch("forbin.config.MCP_SERVER_URL", "http://test.local/mcp"),
+            patch("forbin.config.MCP_TOKEN", "test-token"),
+            patch("forbin.client.Client", return_value=mock_client),
+            patch("asyncio.sleep", new_callable=AsyncMock),
+        ):
+            session, tools = await forbin.client.connect_and_list_tools(max_attempts=2)
+
+            assert session is None
+            assert [t.name for t in tools] == ["test_tool", "simple_tool"]
+
+    @pytest.mark.asyncio
+    async def test_fresh_cache_skips_listing(self, mock_tool_list):
+        """Test that a cache younger than FORBIN_TOOLS_CACHE_TTL replaces list_tools."""
+        forbin.tool_cache.save_tools("http://test.local/mcp", mock_tool_list)
+        mock_session = AsyncMock()
+        mock_client = AsyncMock()
+        mock_client.__aenter__ = AsyncMock(return_value=mock_session)
+
+        with (
+            patch("forbin.config.MCP_SERVER_URL", "http://test.local/mcp"),
+            patch("forbin.config.MCP_TOKEN", "test-token"),
+            patch("forbin.client.Client", return_value=mock_client),
+            patch("forbin.client._TOOLS_CACHE_TTL", 3600.0),
+        ):
+            session, tools = await forbin.client.connect_and_list_tools(max_attempts=1)
+
+            assert session is not None
+            assert [t.name for t in tools] == ["test_tool", "simple_tool"]
+            mock_session.list_tools.assert_not_called()
+
 
 class TestListTools:
     """Test tool listing functionality."""
@@ -264,33 +750,194 @@ class TestCallTool:
         captured = capsys.readouterr()
         assert "Tool execution failed" in captured.out
 
+    @pytest.mark.asyncio
+    async def test_call_tool_keeps_indented_json_as_sent(self, mock_mcp_client, mock_tool, capsys):
+        """Test that pre-indented JSON is shown as sent while compact JSON is re-indented."""
+        mock_mcp_client.call_tool.return_value.content[0].text = '{\n    "four": 4\n}'
+        await forbin.tools.call_tool(mock_mcp_client, mock_tool, {})
+        assert '    "four": 4' in capsys.readouterr().out
+
+        mock_mcp_client.call_tool.return_value.content[0].text = '{"two": 2}'
+        await forbin.tools.call_tool(mock_mcp_client, mock_tool, {})
+        out = capsys.readouterr().out
+        assert '  "two": 2' in out and '    "two"' not in out
+
+    @pytest.mark.asyncio
+    async def test_call_tool_formats_large_json_off_loop(self, mock_mcp_client, mock_tool, capsys):
+        """Test that a large JSON response is formatted on a worker thread."""
+        payload = {"items": ["x" * 100] * 1000, "marker": "end-of-payload"}
+        mock_mcp_client.call_tool.return_value.content[0].text = json.dumps(payload)
+
+        with patch("asyncio.to_thread", wraps=asyncio.to_thread) as to_thread:
+            await forbin.tools.call_tool(mock_mcp_client, mock_tool, {})
+
+            to_thread.assert_called_once_with(
+                forbin.tools._print_result, mock_mcp_client.call_tool.return_value.content
+            )
+        assert "end-of-payload" in capsys.readouterr().out
+
+    @pytest.mark.asyncio
+    async def test_escape_pressed_completes_on_esc(self):
+        """Test that ESC typed on the terminal ends the wait, and other keys don't."""
+        import os
+        import pty
+
+        master, slave = pty.openpty()
+        tty_stdin = Mock()
+        tty_stdin.isatty = Mock(return_value=True)
+        tty_stdin.fileno = Mock(return_value=slave)
+
+        try:
+            with patch("sys.stdin", tty_stdin), forbin.tools._escape_pressed() as esc:
+                os.write(master, b"abc")
+                await asyncio.sleep(0.05)
+                assert not esc.done()
+
+                os.write(master, b"\x1b")
+                await asyncio.wait_for(esc, timeout=1)
+        finally:
+            os.close(master)
+            os.close(slave)
+
+    @pytest.mark.asyncio
+    async def test_escape_pressed_survives_hangup(self):
+        """Test that a hung-up terminal is unregistered and doesn't break cleanup."""
+        import os
+        import pty
+
+        master, slave = pty.openpty()
+        tty_stdin = Mock()
+        tty_stdin.isatty = Mock(return_value=True)
+        tty_stdin.fileno = Mock(return_value=slave)
+        loop = asyncio.get_running_loop()
+
+        try:
+            with (
+                patch("sys.stdin", tty_stdin),
+                patch.object(loop, "remove_reader", wraps=loop.remove_reader) as remove_reader,
+                forbin.tools._escape_pressed() as esc,
+            ):
+                os.close(master)
+                master = None
+                for _ in range(100):
+                    if remove_reader.called:
+                        break
+                    await asyncio.sleep(0.01)
+
+                remove_reader.assert_called_with(slave)
+                assert not esc.done()
+        finally:
+            if master is not None:
+                os.close(master)
+            os.close(slave)
+
+    @pytest.mark.asyncio
+    async def test_escape_cancels_tool_call(self, mock_tool, capsys):
+        """Test that ESC during a call cancels it instead of waiting for the result."""
+
+        async def never_returns(*args):
+            await asyncio.Event().wait()
+
+        session = AsyncMock()
+        session.call_tool = AsyncMock(side_effect=never_returns)
+        esc = asyncio.get_running_loop().create_future()
+        esc.set_result(None)
+        pressed = Mock()
+        pressed.return_value.__enter__ = Mock(return_value=esc)
+        pressed.return_value.__exit__ = Mock(return_value=None)
+
+        with patch("forbin.tools._escape_pressed", pressed):
+            await asyncio.wait_for(forbin.tools.call_tool(session, mock_tool, {}), timeout=1)
+
+        assert "Cancelled by user" in capsys.readouterr().out
+
+    @pytest.mark.asyncio
+    async def test_verbose_logs_multi_block_response_once(self):
+        """Test that a multi-block response is logged as a single verbose panel."""
+        result = Mock()
+        result.is_error = False
+        result.content = [Mock(text='{"a": 1}'), Mock(text='{"b": 2}'), Mock(text=None)]
+        session = AsyncMock()
+        session.call_tool = AsyncMock(return_value=result)
+
+        with (
+            patch("forbin.config.VERBOSE", True),
+            patch("forbin.client.vlog_json") as mock_vlog_json,
+        ):
+            await forbin.client.MCPSession(Mock(), session).call_tool("test_tool", {})
+
+            raw_logs = [c for c in mock_vlog_json.call_args_list if "Raw Response" in c.args[0]]
+            assert len(raw_logs) == 1
+            assert raw_logs[0].args == ("Raw Response (2 blocks)", '{"a": 1}\n{"b": 2}')
+
+
+class TestRunBatch:
+    """Test concurrent batch tool calls."""
+
+    @pytest.mark.asyncio
+    async def test_run_batch_bounded_concurrency(self, mock_tool, mock_tool_no_params):
+        """Test that calls overlap up to the limit and results keep input order."""
+        in_flight = {"now": 0, "max": 0}
+
+        async def call_tool(name, params):
+            in_flight["now"] += 1
+            in_flight["max"] = max(in_flight["max"], in_flight["now"])
+            await asyncio.sleep(0.01)
+            in_flight["now"] -= 1
+            return name
+
+        session = Mock()
+        session.call_tool = AsyncMock(side_effect=call_tool)
+        tools = [mock_tool, mock_tool_no_params, mock_tool]
+
+        results = await forbin.tools.run_batch(session, tools, [{}, {}, {}], concurrency=2)
+
+        assert [outcome for _, outcome, _ in results] == ["test_tool", "simple_tool", "test_tool"]
+        assert in_flight["max"] == 2
+
+    @pytest.mark.asyncio
+    async def test_run_batch_captures_failures(self, mock_tool, mock_tool_no_params, capsys):
+        """Test that one failing call doesn't stop the rest of the batch."""
+        ok = Mock()
+        ok.is_error = False
+        ok.content = [Mock(text="all good")]
+
+        session = Mock()
+        session.call_tool = AsyncMock(side_effect=[RuntimeError("boom"), ok])
+
+        results = await forbin.tools.run_batch(session, [mock_tool, mock_tool_no_params], [{}, {}])
+        assert isinstance(results[0][1], RuntimeError)
+        assert results[1][1] is ok
+
+        forbin.display.display_batch_results(results)
+        captured = capsys.readouterr()
+        assert "failed" in captured.out
+        assert "all good" in captured.out
+
 
 class TestFilteredStderr:
     """Test stderr filtering."""
 
-    def test_filter_suppressed_pattern(self):
+    def test_filter_suppressed_pattern(self, filtered_stderr):
         """Test that suppressed patterns are filtered."""
-        original_stderr = StringIO()
-        filtered = forbin.utils.FilteredStderr(original_stderr)
+        filtered, original_stderr = filtered_stderr
 
         filtered.write("Error in post_writer\n")
         filtered.write("Session termination failed\n")
 
         assert original_stderr.getvalue() == ""
 
-    def test_filter_normal_output(self):
+    def test_filter_normal_output(self, filtered_stderr):
         """Test that normal output passes through."""
-        original_stderr = StringIO()
-        filtered = forbin.utils.FilteredStderr(original_stderr)
+        filtered, original_stderr = filtered_stderr
 
         filtered.write("Normal error message\n")
 
         assert "Normal error message" in original_stderr.getvalue()
 
-    def test_filter_suppression_ends_on_blank_line(self):
+    def test_filter_suppression_ends_on_blank_line(self, filtered_stderr):
         """Test that suppression ends on blank line."""
-        original_stderr = StringIO()
-        filtered = forbin.utils.FilteredStderr(original_stderr)
+        filtered, original_stderr = filtered_stderr
 
         filtered.write("Error in post_writer\n")
         filtered.write("traceback details\n")
@@ -300,6 +947,343 @@ class TestFilteredStderr:
         assert "New message" in original_stderr.getvalue()
         assert "post_writer" not in original_stderr.getvalue()
 
+    def test_filter_pattern_split_across_writes(self, filtered_stderr):
+        """Test that a pattern split over several writes is still suppressed."""
+        filtered, original_stderr = filtered_stderr
+
+        for fragment in ("Error ", "in ", "post_writer", "\n", "\n", "Normal message"):
+            filtered.write(fragment)
+        assert original_stderr.getvalue() == ""
+
+        filtered.flush()
+        assert original_stderr.getvalue() == "Normal message"
+
+
+class TestAsyncInput:
+    """Test async wrappers around blocking stdin reads."""
+
+    @pytest.mark.asyncio
+    async def test_ainput_returns_value(self):
+        """Test that ainput returns what input() read."""
+        with patch("builtins.input", return_value="hello") as mock_input:
+            result = await forbin.utils.ainput("Prompt: ")
+
+            assert result == "hello"
+            mock_input.assert_called_once_with("Prompt: ")
+
+    @pytest.mark.asyncio
+    async def test_ainput_propagates_errors(self):
+        """Test that errors raised by input() reach the awaiting caller."""
+        with patch("builtins.input", side_effect=EOFError):
+            with pytest.raises(EOFError):
+                await forbin.utils.ainput()
+
+    @pytest.mark.asyncio
+    async def test_ainput_keeps_loop_running(self):
+        """Test that other tasks progress while input() is blocked."""
+        release = threading.Event()
+
+        def blocking_input(prompt):
+            # Only released if the event loop keeps running other tasks
+            return "done" if release.wait(timeout=2) else "blocked"
+
+        async def ticker():
+            await asyncio.sleep(0)
+            release.set()
+
+        with patch("builtins.input", side_effect=blocking_input):
+            tick = asyncio.create_task(ticker())
+            result = await forbin.utils.ainput()
+            await tick
+
+            assert result == "done"
+
+
+class TestListenForToggle:
+    """Test the background 'v' key listener."""
+
+    @pytest.mark.asyncio
+    async def test_toggles_on_keypress_without_polling(self):
+        """Test that a 'v' typed on the terminal toggles verbose via the event loop."""
+        import os
+        import pty
+
+        master, slave = pty.openpty()
+        tty_stdin = Mock()
+        tty_stdin.isatty = Mock(return_value=True)
+        tty_stdin.fileno = Mock(return_value=slave)
+
+        try:
+            with (
+                patch("sys.stdin", tty_stdin),
+                patch("forbin.config.VERBOSE", False),
+                patch("forbin.display.console"),
+            ):
+                listener = asyncio.create_task(forbin.utils.listen_for_toggle())
+                await asyncio.sleep(0)
+                os.write(master, b"xv")
+
+                for _ in range(100):
+                    if forbin.config.VERBOSE:
+                        break
+                    await asyncio.sleep(0.01)
+
+                assert forbin.config.VERBOSE is True
+                listener.cancel()
+                with pytest.raises(asyncio.CancelledError):
+                    await listener
+        finally:
+            os.close(master)
+            os.close(slave)
+
+    @pytest.mark.asyncio
+    async def test_stops_watching_stdin_at_eof(self):
+        """Test that the listener unregisters stdin once the terminal goes away."""
+        import os
+        import pty
+
+        master, slave = pty.openpty()
+        tty_stdin = Mock()
+        tty_stdin.isatty = Mock(return_value=True)
+        tty_stdin.fileno = Mock(return_value=slave)
+        loop = asyncio.get_running_loop()
+
+        try:
+            with (
+                patch("sys.stdin", tty_stdin),
+                patch.object(loop, "remove_reader", wraps=loop.remove_reader) as remove_reader,
+            ):
+                listener = asyncio.create_task(forbin.utils.listen_for_toggle())
+                await asyncio.sleep(0)
+                # Closing the master side hangs up the terminal
+                os.close(master)
+                master = None
+
+                for _ in range(100):
+                    if remove_reader.called:
+                        break
+                    await asyncio.sleep(0.01)
+
+                remove_reader.assert_called_with(slave)
+                assert not listener.done()
+                listener.cancel()
+                with pytest.raises(asyncio.CancelledError):
+                    await listener
+        finally:
+            if master is not None:
+                os.close(master)
+            os.close(slave)
+
+
+class TestAsyncLoopThread:
+    """Test the persistent background event loop."""
+
+    def test_run_returns_result_from_loop_thread(self):
+        """Test that coroutines run on the background thread and return their result."""
+        loop_thread = forbin.async_loop.AsyncLoopThread()
+        try:
+
+            async def where():
+                return threading.current_thread().name
+
+            assert loop_thread.run(where()) == "forbin-loop"
+            # The same loop serves every call
+            assert loop_thread.submit(asyncio.sleep(0, result=42)).result(timeout=2) == 42
+        finally:
+            loop_thread.stop()
+
+        assert loop_thread.loop.is_closed()
+
+    def test_run_propagates_exceptions(self):
+        """Test that exceptions raised on the loop reach the caller."""
+        loop_thread = forbin.async_loop.AsyncLoopThread()
+        try:
+
+            async def fail():
+                raise ValueError("boom")
+
+            with pytest.raises(ValueError, match="boom"):
+                loop_thread.run(fail())
+        finally:
+            loop_thread.stop()
+
+    def test_new_event_loop_prefers_uvloop(self):
+        """Test that uvloop is used when installed and the stdlib loop otherwise."""
+        fake_uvloop = Mock()
+        with patch("forbin.async_loop.uvloop", fake_uvloop):
+            assert forbin.async_loop.new_event_loop() is fake_uvloop.new_event_loop.return_value
+
+        with patch("forbin.async_loop.uvloop", None):
+            loop = forbin.async_loop.new_event_loop()
+            try:
+                assert isinstance(loop, asyncio.AbstractEventLoop)
+            finally:
+                loop.close()
+
+
+class TestConfigCache:
+    """Test the mtime-keyed config file cache."""
+
+    def test_load_config_parses_unchanged_file_once(self, tmp_path, monkeypatch):
+        """Test that repeated loads of an unchanged file skip re-parsing."""
+        config_file = tmp_path / "config.json"
+        config_file.write_text('{"MCP_TOKEN": "abc"}')
+        monkeypatch.setattr(forbin.config, "CONFIG_FILE", config_file)
+
+        with patch("forbin.jsonfmt.loads", wraps=forbin.jsonfmt.loads) as mock_load:
+            first = forbin.config.load_config()
+            first["MCP_TOKEN"] = "mutated"
+            second = forbin.config.load_config()
+
+            assert second == {"MCP_TOKEN": "abc"}
+            assert mock_load.call_count == 1
+
+    def test_load_config_sees_external_changes(self, tmp_path, monkeypatch):
+        """Test that a rewritten file is parsed again."""
+        import os
+
+        config_file = tmp_path / "config.json"
+        config_file.write_text('{"MCP_TOKEN": "abc"}')
+        monkeypatch.setattr(forbin.config, "CONFIG_FILE", config_file)
+        assert forbin.config.load_config() == {"MCP_TOKEN": "abc"}
+
+        config_file.write_text('{"MCP_TOKEN": "xyz1"}')
+        st = config_file.stat()
+        os.utime(config_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        assert forbin.config.load_config() == {"MCP_TOKEN": "xyz1"}
+
+    @pytest.mark.parametrize("content", ["[1, 2]", "42", "null"])
+    def test_load_config_rejects_non_object(self, tmp_path, monkeypatch, content):
+        """Test that valid JSON that isn't an object falls back to an empty config."""
+        config_file = tmp_path / "config.json"
+        config_file.write_text(content)
+        monkeypatch.setattr(forbin.config, "CONFIG_FILE", config_file)
+
+        with patch("forbin.display.console"):
+            assert forbin.config.load_config() == {}
+            assert forbin.config.load_config() == {}
+
+    def test_save_config_refreshes_cache(self, tmp_path, monkeypatch):
+        """Test that saving updates the cache without another parse."""
+        config_file = tmp_path / "config.json"
+        monkeypatch.setattr(forbin.config, "CONFIG_FILE", config_file)
+        monkeypatch.setattr(forbin.config, "FORBIN_DIR", tmp_path)
+
+        assert forbin.config.save_config({"VERBOSE": "true"})
+        with patch("forbin.jsonfmt.loads") as mock_load:
+            assert forbin.config.load_config() == {"VERBOSE": "true"}
+            mock_load.assert_not_called()
+
+    def test_reload_from_saved_dict_skips_file(self, monkeypatch):
+        """Test that reload_config(cfg) uses the dict, with env vars still taking priority."""
+        for name in ("MCP_SERVER_URL", "MCP_TOKEN", "MCP_HEALTH_URL", "VERBOSE"):
+            monkeypatch.setattr(forbin.config, name, getattr(forbin.config, name))
+            monkeypatch.delenv(name, raising=False)
+        monkeypatch.setenv("MCP_TOKEN", "from-env")
+
+        with patch("forbin.config.load_config") as mock_load:
+            forbin.config.reload_config(
+                {"MCP_SERVER_URL": "http://saved/mcp", "MCP_TOKEN": "saved", "VERBOSE": "true"}
+            )
+            mock_load.assert_not_called()
+
+        assert forbin.config.MCP_SERVER_URL == "http://saved/mcp"
+        assert forbin.config.MCP_TOKEN == "from-env"
+        assert forbin.config.MCP_HEALTH_URL is None
+        assert forbin.config.VERBOSE is True
+
+    @pytest.mark.parametrize(
+        "value,expected",
+        [("true", True), (" Yes ", True), ("on", True), ("1", True), ("", False), ("off", False)],
+    )
+    def test_verbose_truthy_values(self, value, expected):
+        """Test which VERBOSE spellings turn verbose mode on."""
+        assert forbin.config._is_truthy(value) is expected
+
+
+class TestFirstTimeSetup:
+    """Test the first-run configuration wizard."""
+
+    @pytest.mark.asyncio
+    async def test_wizard_saves_answers(self, tmp_path, monkeypatch):
+        """Test that the wizard re-asks required fields and saves what was entered."""
+        config_file = tmp_path / "config.json"
+        monkeypatch.setattr(forbin.config, "CONFIG_FILE", config_file)
+        monkeypatch.setattr(forbin.config, "FORBIN_DIR", tmp_path)
+        for name in ("MCP_SERVER_URL", "MCP_TOKEN", "MCP_HEALTH_URL", "VERBOSE"):
+            monkeypatch.setattr(forbin.config, name, getattr(forbin.config, name))
+            monkeypatch.delenv(name, raising=False)
+
+        answers = iter(["", "http://test.local/mcp", "secret", ""])
+        with (
+            patch("builtins.input", side_effect=lambda prompt: next(answers)) as mock_input,
+            patch("forbin.display.console"),
+        ):
+            await forbin.config.run_first_time_setup()
+
+            assert mock_input.call_count == 4
+            assert forbin.config.load_config() == {
+                "MCP_SERVER_URL": "http://test.local/mcp",
+                "MCP_TOKEN": "secret",
+            }
+            assert forbin.config.MCP_TOKEN == "secret"
+
+
+class TestVerboseTiming:
+    """Test the verbose timing helpers."""
+
+    def test_vtimed_skips_clock_when_quiet(self, capsys):
+        """Test that timing is skipped entirely when verbose is off."""
+        with (
+            patch("forbin.config.VERBOSE", False),
+            patch("forbin.verbose.time.monotonic") as mock_clock,
+        ):
+            with forbin.verbose.vtimed("Quiet step"):
+                pass
+
+            mock_clock.assert_not_called()
+            assert "Quiet step" not in capsys.readouterr().out
+
+    def test_vtimed_logs_on_early_exit(self, capsys):
+        """Test that a block left early (e.g. by return) is still timed."""
+
+        def step():
+            with forbin.verbose.vtimed("Early step"):
+                return "done"
+
+        with patch("forbin.config.VERBOSE", True):
+            assert step() == "done"
+
+        assert "Early step" in capsys.readouterr().out
+
+
+class TestToggleVerbose:
+    """Test persisting the verbose toggle."""
+
+    def test_toggle_persists_new_value(self, capsys):
+        """Test that toggling writes the new value to the config file."""
+        with (
+            patch("forbin.config.VERBOSE", False),
+            patch("forbin.cli.load_config", return_value={"VERBOSE": "false"}),
+            patch("forbin.cli.save_config") as mock_save,
+        ):
+            forbin.cli._toggle_verbose()
+
+            assert forbin.config.VERBOSE is True
+            mock_save.assert_called_once_with({"VERBOSE": "true"})
+
+    def test_toggle_skips_write_when_unchanged(self, capsys):
+        """Test that no rewrite happens if the file already holds the new value."""
+        with (
+            patch("forbin.config.VERBOSE", True),
+            patch("forbin.cli.load_config", return_value={"VERBOSE": "false"}),
+            patch("forbin.cli.save_config") as mock_save,
+        ):
+            forbin.cli._toggle_verbose()
+
+            assert forbin.config.VERBOSE is False
+            mock_save.assert_not_called()
+
 
 class TestMainFunction:
     """Test main entry point."""
@@ -314,6 +1298,41 @@ class TestMainFunction:
             assert "MCP Remote Tool Tester" in captured.out
             assert "Usage:" in captured.out
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("argv, preloads", [(["forbin"], True), (["forbin", "--help"], False)])
+    async def test_main_preloads_client_only_when_connecting(self, argv, preloads):
+        """Test that the MCP client stack starts loading early only for commands that connect."""
+        with (
+            patch("sys.argv", argv),
+            patch("forbin.cli.interactive_session", new_callable=AsyncMock),
+            patch("forbin.cli._preload_client_module") as preload,
+        ):
+            await forbin.cli.async_main()
+
+            assert preload.called is preloads
+
+    def test_import_does_not_load_mcp_client(self):
+        """Test that importing the package (and so --help) skips the MCP client stack."""
+        import subprocess
+        import sys
+
+        code = "import sys, forbin; assert 'fastmcp' not in sys.modules; forbin.MCPSession"
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+        assert result.returncode == 0, result.stderr
+
+    def test_skip_dotenv_avoids_loading_it(self):
+        """Test that FORBIN_SKIP_DOTENV keeps python-dotenv from being imported at all."""
+        import os
+        import subprocess
+        import sys
+
+        code = "import sys, forbin.config; assert 'dotenv' not in sys.modules"
+        env = {**os.environ, "FORBIN_SKIP_DOTENV": "1"}
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, env=env
+        )
+        assert result.returncode == 0, result.stderr
+
     @pytest.mark.asyncio
     async def test_main_test_mode(self, mock_mcp_client, mock_httpx_client):
         """Test connectivity test mode."""